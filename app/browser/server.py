@@ -1,7 +1,9 @@
 """Local HTTP server that the SessionVault browser extension talks to.
 
 Binds exclusively to 127.0.0.1 so it is never reachable from the network.
-Runs in a daemon thread managed by :class:`BrowserServer`.
+Runs in a daemon thread managed by :class:`BrowserServer`; accepted
+connections are served by a bounded pool of reusable worker threads rather
+than one new thread per connection.
 
 API
 ---
@@ -28,32 +30,142 @@ Written by Christopher Malo
 from __future__ import annotations
 
 import json
+import logging
+import queue
 import threading
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import MappingProxyType
 from urllib.parse import urlparse
 
 from app.constants import APP_NAME, APP_VERSION
 from app.managers.keepass import keepass_manager
 from app.managers.logger import get_logger
 
+try:
+    import orjson
+
+    def _dumps(data, default=None) -> bytes:
+        return orjson.dumps(data, default=default)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data, default=None) -> bytes:
+        return json.dumps(data, default=default or str).encode()
+
+    _loads = json.loads
+
 log = get_logger(__name__)
 
 DEFAULT_PORT = 19456
 
+# Worker threads serving accepted connections.  A worker is held for the
+# whole life of a keep-alive connection, not one request, so the pool starts
+# with _WORKERS threads and grows on demand up to _MAX_WORKERS — above the
+# six connections per host a browser keeps open — before queueing.
+_WORKERS = 4
+_MAX_WORKERS = 16
+
+# Fields each POST endpoint reads from its JSON body.  Anything else the
+# extension sends (notes, page metadata, …) is dropped straight after the
+# parse, as are values that are not strings.
+_BODY_FIELDS: dict[str, tuple[str, ...]] = {
+    "/get-logins":   ("url",),
+    "/save-login":   ("url", "title", "username", "password", "group"),
+    "/update-login": ("uuid", "username", "password", "url", "title"),
+}
+
+# Request bodies larger than this are neither read nor parsed.
+_MAX_BODY = 64 * 1024
+
+# Shared result for requests without a usable body; handlers only ever call
+# .get() on it, and the proxy keeps it from being mutated by accident.
+_EMPTY_BODY = MappingProxyType({})
+
+# CORS headers sent on every response, pre-encoded once.
+_CORS_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+)
+
+# Status line and fixed headers of every JSON response, with slots for the
+# status code, reason phrase and body length.  _json() fills it in and
+# sends head and body with a single write.
+_JSON_HEAD = (
+    b"HTTP/1.1 %d %s\r\n"
+    + _CORS_HEADERS
+    + b"Content-Type: application/json\r\n"
+    b"Content-Length: %d\r\n"
+)
+
+# Complete CORS preflight response.  Max-Age lets the browser cache the
+# preflight result instead of repeating it before every POST.
+_PREFLIGHT = (
+    b"HTTP/1.1 204 No Content\r\n"
+    + _CORS_HEADERS
+    + b"Access-Control-Max-Age: 600\r\n"
+    b"\r\n"
+)
+_PREFLIGHT_CLOSE = _PREFLIGHT[:-2] + b"Connection: close\r\n\r\n"
+
 
 # ---------------------------------------------------------------------------
 # Request handler
 # ---------------------------------------------------------------------------
 
+def _entry_json(entry) -> dict:
+    """Serialiser ``default`` hook turning a pykeepass Entry into its JSON row.
+
+    Passing entries straight to the serialiser lets it walk the list itself
+    instead of building every row dict up front in Python.
+    """
+    return {
+        "uuid":     str(entry.uuid),
+        "title":    entry.title    or "",
+        "username": entry.username or "",
+        "password": entry.password or "",
+        "url":      entry.url      or "",
+    }
+
+
+@lru_cache(maxsize=512)
+def _hostname_of(url: str) -> str | None:
+    """Memoised ``urlparse(url).hostname``.
+
+    The extension asks about the same few URLs over and over (one per open
+    tab), so repeated lookups skip the parse entirely.
+    """
+    return urlparse(url).hostname
+
+
 class _Handler(BaseHTTPRequestHandler):
     """HTTP request handler for the browser integration API."""
 
+    # Keep connections open between requests so the extension does not pay
+    # a TCP handshake per call; every response carries a Content-Length.
+    # Idle connections are dropped after ``timeout`` seconds to free the
+    # worker thread serving them; the extension re-connects on its next call.
+    protocol_version = "HTTP/1.1"
+    timeout = 2
+
     # Silence the default per-request log to stderr; we use our own logger.
+    # Both hooks bail out early when DEBUG is filtered so the request line
+    # is never formatted for nothing.
+    def log_request(self, code="-", size="-") -> None:
+        if log.isEnabledFor(logging.DEBUG):
+            super().log_request(code, size)
+
     def log_message(self, fmt: str, *args) -> None:
-        log.debug("browser-server: " + fmt, *args)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("browser-server: " + fmt, *args)
 
     def log_error(self, fmt: str, *args) -> None:
-        log.error("browser-server: " + fmt, *args)
+        # An idle keep-alive connection timing out is routine, not an error
+        if fmt.startswith("Request timed out"):
+            log.debug("browser-server: " + fmt, *args)
+        else:
+            log.error("browser-server: " + fmt, *args)
 
     # ------------------------------------------------------------------
     # Verb dispatch
@@ -61,38 +173,39 @@ class _Handler(BaseHTTPRequestHandler):
 
     def do_OPTIONS(self) -> None:
         """Handle CORS preflight."""
-        self.send_response(204)
-        self._cors_headers()
-        self.end_headers()
+        self._refuse_body()
+        self.log_request(204)
+        self.wfile.write(_PREFLIGHT_CLOSE if self.close_connection else _PREFLIGHT)
 
     def do_GET(self) -> None:
-        if self.path.split("?")[0] == "/ping":
-            self._json({
-                "appName":  APP_NAME,
-                "version":  APP_VERSION,
-                "dbOpen":   keepass_manager.is_open,
-                "dbCount":  len(keepass_manager.open_paths),
-            })
-        else:
+        self._refuse_body()
+        handler = self._GET_ROUTES.get(self.path.partition("?")[0])
+        if handler is None:
             self._json({"error": "not_found"}, 404)
+        else:
+            handler(self)
 
     def do_POST(self) -> None:
-        body = self._read_body()
-        path = self.path.split("?")[0]
-
-        if path == "/get-logins":
-            self._handle_get_logins(body)
-        elif path == "/save-login":
-            self._handle_save_login(body)
-        elif path == "/update-login":
-            self._handle_update_login(body)
-        else:
+        path = self.path.partition("?")[0]
+        body = self._read_body(_BODY_FIELDS.get(path, ()))
+        handler = self._POST_ROUTES.get(path)
+        if handler is None:
             self._json({"error": "not_found"}, 404)
+        else:
+            handler(self, body)
 
     # ------------------------------------------------------------------
     # Handlers
     # ------------------------------------------------------------------
 
+    def _handle_ping(self) -> None:
+        self._json({
+            "appName":  APP_NAME,
+            "version":  APP_VERSION,
+            "dbOpen":   keepass_manager.is_open,
+            "dbCount":  len(keepass_manager.open_paths),
+        })
+
     def _handle_get_logins(self, body: dict) -> None:
         url = body.get("url", "").strip()
         if not url:
@@ -101,37 +214,25 @@ class _Handler(BaseHTTPRequestHandler):
         if not keepass_manager.is_open:
             self._json({"error": "no_database_open", "entries": []}, 200)
             return
-        entries = keepass_manager.find_entries_for_url(url)
-        log.debug(
-            "get-logins: url=%s  matches=%d",
-            urlparse(url).hostname, len(entries),
-        )
-        self._json({
-            "entries": [
-                {
-                    "uuid":     str(e.uuid),
-                    "title":    e.title    or "",
-                    "username": e.username or "",
-                    "password": e.password or "",
-                    "url":      e.url      or "",
-                }
-                for e in entries
-            ]
-        })
+        host = _hostname_of(url)
+        entries = keepass_manager.find_entries_for_host(host or "")
+        log.debug("get-logins: url=%s  matches=%d", host, len(entries))
+        self._json({"entries": entries}, default=_entry_json)
 
     def _handle_save_login(self, body: dict) -> None:
         if not keepass_manager.is_open:
             self._json({"error": "no_database_open", "success": False}, 200)
             return
-        url   = body.get("url",      "").strip()
-        title = (body.get("title",   "").strip()
-                 or urlparse(url).hostname
+        get   = body.get
+        url   = get("url",      "").strip()
+        title = (get("title",   "").strip()
+                 or _hostname_of(url)
                  or "Saved Login")
         entry = keepass_manager.add_entry(
-            group_name=body.get("group", "Browser"),
+            group_name=get("group", "Browser"),
             title=title,
-            username=body.get("username", ""),
-            password=body.get("password", ""),
+            username=get("username", ""),
+            password=get("password", ""),
             url=url,
         )
         success = entry is not None
@@ -139,16 +240,17 @@ class _Handler(BaseHTTPRequestHandler):
         self._json({"success": success})
 
     def _handle_update_login(self, body: dict) -> None:
-        uid = body.get("uuid", "").strip()
+        get = body.get
+        uid = get("uuid", "").strip()
         if not uid:
             self._json({"error": "uuid_required"}, 400)
             return
         ok = keepass_manager.update_entry(
             uid,
-            username=body.get("username"),
-            password=body.get("password"),
-            url=body.get("url"),
-            title=body.get("title"),
+            username=get("username"),
+            password=get("password"),
+            url=get("url"),
+            title=get("title"),
         )
         log.info("update-login: uuid=%s  success=%s", uid, ok)
         self._json({"success": ok})
@@ -157,28 +259,146 @@ class _Handler(BaseHTTPRequestHandler):
     # Helpers
     # ------------------------------------------------------------------
 
-    def _read_body(self) -> dict:
-        length = int(self.headers.get("Content-Length", 0))
+    def _refuse_body(self) -> None:
+        """Close the connection after a bodyless verb that carries a body.
+
+        The body is never read, so on a kept-alive connection its bytes
+        would be parsed as the next request.
+        """
+        cl = self.headers["Content-Length"]
+        if self.headers["Transfer-Encoding"] or (cl and cl.strip() != "0"):
+            self.close_connection = True
+
+    def _read_body(self, fields: tuple[str, ...]) -> dict:
+        """Parse the JSON body and keep only the string values of *fields*.
+
+        Bodies for unknown endpoints, over ``_MAX_BODY`` bytes, with a
+        negative or malformed ``Content-Length``, or sent with a
+        ``Transfer-Encoding`` are left unread and the connection is closed
+        after the response.
+        """
+        if self.headers["Transfer-Encoding"]:
+            self.close_connection = True
+            return _EMPTY_BODY
+        cl = self.headers["Content-Length"]
+        try:
+            length = int(cl) if cl else 0
+        except ValueError:
+            length = -1
         if length == 0:
-            return {}
+            return _EMPTY_BODY
+        if not fields or not 0 < length <= _MAX_BODY:
+            self.close_connection = True
+            return _EMPTY_BODY
         try:
-            return json.loads(self.rfile.read(length))
+            data = _loads(self.rfile.read(length))
         except Exception:
-            return {}
+            return _EMPTY_BODY
+        if not isinstance(data, dict):
+            return _EMPTY_BODY
+        return {
+            key: value for key in fields
+            if isinstance(value := data.get(key), str)
+        }
+
+    def _json(self, data: dict, status: int = 200, default=None) -> None:
+        payload = _dumps(data, default)
+        self.log_request(status)
+        head = _JSON_HEAD % (status, self.responses[status][0].encode(), len(payload))
+        if self.close_connection:
+            head += b"Connection: close\r\n"
+        self.wfile.write(head + b"\r\n" + payload)
+
+    # Path → handler tables, built once when the class is created.
+    _GET_ROUTES = {
+        "/ping": _handle_ping,
+    }
+    _POST_ROUTES = {
+        "/get-logins":   _handle_get_logins,
+        "/save-login":   _handle_save_login,
+        "/update-login": _handle_update_login,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
 
-    def _json(self, data: dict, status: int = 200) -> None:
-        payload = json.dumps(data).encode()
-        self.send_response(status)
-        self._cors_headers()
-        self.send_header("Content-Type",   "application/json")
-        self.send_header("Content-Length", str(len(payload)))
-        self.end_headers()
-        self.wfile.write(payload)
+class _PooledHTTPServer(HTTPServer):
+    """:class:`HTTPServer` that hands connections to a bounded worker pool.
 
-    def _cors_headers(self) -> None:
-        self.send_header("Access-Control-Allow-Origin",  "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+    ``ThreadingHTTPServer`` spawns (and tears down) an OS thread for every
+    connection.  Here the accept loop only queues the socket; long-lived
+    daemon workers pick it up.  Each worker serves one connection at a
+    time, so when none is idle a new one is started, up to
+    ``max_workers``; past that, connections wait for a worker to free up.
+
+    The address is bound with ``SO_REUSEADDR`` (inherited from
+    :class:`HTTPServer`) so a restart on the same port does not trip over
+    sockets still in ``TIME_WAIT``.  ``SO_REUSEPORT`` is deliberately not
+    used: it would let another local process bind the same port and receive
+    password requests.
+    """
+
+    # socketserver's default listen backlog of 5 drops connections when the
+    # extension opens several tabs at once.
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        handler,
+        workers: int = _WORKERS,
+        max_workers: int = _MAX_WORKERS,
+    ) -> None:
+        super().__init__(address, handler)
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+        self._max_workers = max(workers, max_workers)
+        self._lock = threading.Lock()
+        self._workers: list[threading.Thread] = []
+        # Workers waiting for a connection that no queued one is meant for
+        self._idle = workers
+        for _ in range(workers):
+            self._spawn()
+
+    def _spawn(self) -> None:
+        t = threading.Thread(
+            target=self._work,
+            name=f"sessionvault-browser-worker-{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(t)
+        t.start()
+
+    def process_request(self, request, client_address) -> None:
+        with self._lock:
+            if self._idle:
+                self._idle -= 1          # an idle worker will take it
+            elif len(self._workers) < self._max_workers:
+                self._spawn()            # the new worker takes it
+        self._pending.put((request, client_address))
+
+    def _work(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+            with self._lock:
+                self._idle += 1
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._lock:
+            workers = len(self._workers)
+        for _ in range(workers):
+            self._pending.put(None)
 
 
 # ---------------------------------------------------------------------------
@@ -193,7 +413,7 @@ class BrowserServer:
     """
 
     def __init__(self) -> None:
-        self._httpd: ThreadingHTTPServer | None = None
+        self._httpd: _PooledHTTPServer | None = None
         self._thread: threading.Thread | None = None
         self._port: int = DEFAULT_PORT
 
@@ -221,7 +441,7 @@ class BrowserServer:
         if self._httpd is not None:
             return
         self._port = port
-        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._httpd = _PooledHTTPServer(("127.0.0.1", port), _Handler)
         self._thread = threading.Thread(
             target=self._httpd.serve_forever,
             name="sessionvault-browser-server",
@@ -235,6 +455,7 @@ class BrowserServer:
         if self._httpd is None:
             return
         self._httpd.shutdown()
+        self._httpd.server_close()
         self._httpd = None
         self._thread = None
         log.info("Browser integration server stopped")
@@ -242,6 +463,7 @@ class BrowserServer:
     def restart(self, port: int = DEFAULT_PORT) -> None:
         """Stop (if running) then start on *port*."""
         self.stop()
+        _hostname_of.cache_clear()
         self.start(port)
 
 
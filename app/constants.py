@@ -11,8 +11,8 @@ MACROS_FILE     JSON file storing named command macros.
 PLUGINS_DIR     Directory scanned for user .py plugin files.
 LOGS_DIR        Directory for rotating log files.
 
-THEMES          Ordered list of built-in theme names.
-THEME_PALETTES  Dict mapping theme name → color key → hex string.
+THEMES          Read-only ordered mapping of theme name → palette, where each
+                palette is a read-only mapping of color key → hex string.
                 Color keys: base, mantle, crust, surface0, surface1,
                 overlay1, text, blue, green, red, yellow, mauve, pink.
 
@@ -24,6 +24,9 @@ Written by Christopher Malo
 from __future__ import annotations
 
 import pathlib
+from collections.abc import Mapping
+from operator import itemgetter
+from types import MappingProxyType
 
 APP_NAME = "SessionVault"
 APP_VERSION = "2.0.0"
@@ -37,7 +40,7 @@ LOGS_DIR      = DATA_DIR / "logs"
 # ---------------------------------------------------------------------------
 # Catppuccin Mocha (default dark theme)
 # ---------------------------------------------------------------------------
-MOCHA: dict[str, str] = {
+MOCHA: Mapping[str, str] = MappingProxyType({
     "base":      "#1e1e2e",
     "mantle":    "#181825",
     "crust":     "#11111b",
@@ -64,12 +67,12 @@ MOCHA: dict[str, str] = {
     "pink":      "#f5c2e7",
     "flamingo":  "#f2cdcd",
     "rosewater": "#f5e0dc",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Catppuccin Latte (light theme)
 # ---------------------------------------------------------------------------
-LATTE: dict[str, str] = {
+LATTE: Mapping[str, str] = MappingProxyType({
     "base":      "#eff1f5",
     "mantle":    "#e6e9ef",
     "crust":     "#dce0e8",
@@ -96,12 +99,12 @@ LATTE: dict[str, str] = {
     "pink":      "#ea76cb",
     "flamingo":  "#dd7878",
     "rosewater": "#dc8a78",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Dracula
 # ---------------------------------------------------------------------------
-DRACULA: dict[str, str] = {
+DRACULA: Mapping[str, str] = MappingProxyType({
     "base":      "#282a36",
     "mantle":    "#21222c",
     "crust":     "#191a21",
@@ -128,12 +131,12 @@ DRACULA: dict[str, str] = {
     "pink":      "#ff79c6",
     "flamingo":  "#ff79c6",
     "rosewater": "#ffb86c",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Nord
 # ---------------------------------------------------------------------------
-NORD: dict[str, str] = {
+NORD: Mapping[str, str] = MappingProxyType({
     "base":      "#2e3440",
     "mantle":    "#292e39",
     "crust":     "#242933",
@@ -160,12 +163,12 @@ NORD: dict[str, str] = {
     "pink":      "#b48ead",
     "flamingo":  "#d08770",
     "rosewater": "#d08770",
-}
+})
 
 # ---------------------------------------------------------------------------
 # One Dark
 # ---------------------------------------------------------------------------
-ONE_DARK: dict[str, str] = {
+ONE_DARK: Mapping[str, str] = MappingProxyType({
     "base":      "#282c34",
     "mantle":    "#21252b",
     "crust":     "#1b1f27",
@@ -192,45 +195,51 @@ ONE_DARK: dict[str, str] = {
     "pink":      "#c678dd",
     "flamingo":  "#e06c75",
     "rosewater": "#d19a66",
-}
+})
 
-# Registry of all built-in themes
-THEMES: dict[str, dict[str, str]] = {
+# Registry of all built-in themes (read-only, like the palettes themselves)
+THEMES: Mapping[str, Mapping[str, str]] = MappingProxyType({
     "Catppuccin Mocha": MOCHA,
     "Catppuccin Latte": LATTE,
     "Dracula":          DRACULA,
     "Nord":             NORD,
     "One Dark":         ONE_DARK,
-}
+})
 
 # Active palette – mutated at runtime by apply_theme()
 C: dict[str, str] = dict(MOCHA)
 
 
-def _ansi_16(palette: dict) -> list[str]:
+# Palette keys feeding the 16 ANSI colors; one C-level call fetches them all.
+_ANSI_16_KEYS = itemgetter(
+    "surface1",  # 0  black
+    "red",       # 1  red
+    "green",     # 2  green
+    "yellow",    # 3  yellow
+    "blue",      # 4  blue
+    "mauve",     # 5  magenta
+    "teal",      # 6  cyan
+    "text",      # 7  white
+    "surface2",  # 8  bright black
+    "red",       # 9  bright red
+    "green",     # 10 bright green
+    "yellow",    # 11 bright yellow
+    "blue",      # 12 bright blue
+    "mauve",     # 13 bright magenta
+    "teal",      # 14 bright cyan
+    "text",      # 15 bright white
+)
+
+
+def _ansi_16(palette: Mapping[str, str]) -> tuple[str, ...]:
     """Build the standard 16-color ANSI palette from a theme palette."""
-    return [
-        palette["surface1"],  # 0  black
-        palette["red"],       # 1  red
-        palette["green"],     # 2  green
-        palette["yellow"],    # 3  yellow
-        palette["blue"],      # 4  blue
-        palette["mauve"],     # 5  magenta
-        palette["teal"],      # 6  cyan
-        palette["text"],      # 7  white
-        palette["surface2"],  # 8  bright black
-        palette["red"],       # 9  bright red
-        palette["green"],     # 10 bright green
-        palette["yellow"],    # 11 bright yellow
-        palette["blue"],      # 12 bright blue
-        palette["mauve"],     # 13 bright magenta
-        palette["teal"],      # 14 bright cyan
-        palette["text"],      # 15 bright white
-    ]
-
-
-# Standard 8 + bright-8 ANSI terminal colors (mutable – updated by apply_theme)
-ANSI_COLORS_16: list[str] = _ansi_16(MOCHA)
+    return _ANSI_16_KEYS(palette)
+
+
+# Standard 8 + bright-8 ANSI terminal colors.  Immutable: apply_theme() rebinds
+# the name, so read it as ``app.constants.ANSI_COLORS_16`` rather than
+# importing it directly.
+ANSI_COLORS_16: tuple[str, ...] = _ansi_16(MOCHA)
 
 # Mutable cache populated lazily by app.terminal.ansi
 ANSI_256_CACHE: dict[int, str] = {}
@@ -18,20 +18,121 @@ Written by Christopher Malo
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QVBoxLayout,
 )
 
 from app.managers.keepass import keepass_manager
 
+# Typing pause (ms) after which the entry list is re-filtered
+_FILTER_DELAY_MS = 120
+
+_SEARCH_PLACEHOLDER = "Filter by title, username, or group…"
+
+
+def _entry_fields(entry) -> tuple[str, str, str]:
+    """Return *entry*'s (title, username, group name), reading each once.
+
+    pykeepass resolves every property with an XPath query on the entry
+    element, so labels and haystacks are both built from this one tuple.
+    """
+    group = entry.group
+    return (
+        entry.title or "",
+        entry.username or "",
+        (group.name or "") if group else "",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Background loader
+# ---------------------------------------------------------------------------
+
+class _LoaderSignals(QObject):
+    loaded = Signal(object, object, object)   # entries, labels, haystacks
+
+
+class _Loader(QRunnable):
+    """Walks the open database on a pool thread so the dialog paints at once."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _LoaderSignals()
+
+    def run(self) -> None:
+        entries = keepass_manager.get_all_entries()
+        fields = [_entry_fields(e) for e in entries]
+        labels = [
+            f"{group} / {title}   [{user}]" if user else f"{group} / {title}"
+            for title, user, group in fields
+        ]
+        # One lowercase "title\0username\0group" string per entry, so each
+        # keystroke is a single substring test with no re-casing.  The NUL
+        # separator stops a query from matching across two fields.
+        haystacks = [f"{t}\0{u}\0{g}".lower() for t, u, g in fields]
+        self.signals.loaded.emit(entries, labels, haystacks)
+
+
+class _EntryListModel(QAbstractListModel):
+    """Flat list model over KeePass entries with an index-based filter.
+
+    All entries and their display labels are kept in plain lists; filtering
+    only swaps the list of visible row indices, so no per-row Qt objects
+    are ever created.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._entries: list = []
+        self._labels: list[str] = []
+        self._visible: list[int] = []
+
+    def set_entries(self, entries: list, labels: list[str]) -> None:
+        self.beginResetModel()
+        self._entries = entries
+        self._labels = labels
+        self._visible = list(range(len(entries)))
+        self.endResetModel()
+
+    def set_visible(self, rows: list[int]) -> None:
+        """Show only the entries at *rows* (indices into the full list)."""
+        self.beginResetModel()
+        self._visible = rows
+        self.endResetModel()
+
+    def entry(self, row: int):
+        """Entry shown at view *row*."""
+        return self._entries[self._visible[row]]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        i = self._visible[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._labels[i]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._entries[i]
+        return None
+
 
 class KeePassSelectorDialog(QDialog):
     """Browse all entries in the currently open KeePass database."""
@@ -42,6 +143,15 @@ class KeePassSelectorDialog(QDialog):
         self.setMinimumSize(520, 440)
         self.selected_entry = None
         self._all_entries: list = []
+        self._haystacks: list[str] = []
+        # Last applied query and the full-list indices it matched
+        self._last_query = ""
+        self._last_rows: list[int] = []
+        # Coalesces bursts of keystrokes into a single filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
         self._build_ui()
         self._load_entries()
 
@@ -58,14 +168,20 @@ class KeePassSelectorDialog(QDialog):
         search_row = QHBoxLayout()
         search_row.addWidget(QLabel("Search:"))
         self._search_edit = QLineEdit()
-        self._search_edit.setPlaceholderText("Filter by title, username, or group…")
-        self._search_edit.textChanged.connect(self._filter)
+        self._search_edit.setPlaceholderText(_SEARCH_PLACEHOLDER)
+        self._search_edit.textChanged.connect(self._schedule_filter)
         search_row.addWidget(self._search_edit, 1)
         root.addLayout(search_row)
 
         # Entry list
-        self._list = QListWidget()
-        self._list.itemDoubleClicked.connect(self._confirm)
+        self._model = _EntryListModel(self)
+        self._list = QListView()
+        # All rows are single-line labels: let the view size one row and
+        # lay the rest out in batches instead of measuring each entry.
+        self._list.setUniformItemSizes(True)
+        self._list.setLayoutMode(QListView.LayoutMode.Batched)
+        self._list.setModel(self._model)
+        self._list.doubleClicked.connect(self._confirm)
         root.addWidget(self._list, 1)
 
         # Dialog buttons
@@ -85,39 +201,58 @@ class KeePassSelectorDialog(QDialog):
     # ------------------------------------------------------------------
 
     def _load_entries(self) -> None:
-        self._all_entries = keepass_manager.get_all_entries()
-        self._render(self._all_entries)
-
-    def _render(self, entries: list) -> None:
-        self._list.clear()
-        for entry in entries:
-            group = entry.group.name if entry.group else ""
-            label = f"{group} / {entry.title or ''}"
-            if entry.username:
-                label += f"   [{entry.username}]"
-            item = QListWidgetItem(label)
-            item.setData(Qt.ItemDataRole.UserRole, entry)
-            self._list.addItem(item)
+        self._search_edit.setEnabled(False)
+        self._search_edit.setPlaceholderText("Loading…")
+        loader = _Loader()
+        # Hold the signals object so it outlives the (auto-deleted) runnable;
+        # the queued connection delivers the result on the UI thread.
+        self._loader_signals = loader.signals
+        self._loader_signals.loaded.connect(self._on_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_loaded(
+        self, entries: list, labels: list[str], haystacks: list[str]
+    ) -> None:
+        self._loader_signals = None
+        self._all_entries = entries
+        self._haystacks = haystacks
+        self._last_query = ""
+        self._last_rows = list(range(len(entries)))
+        self._model.set_entries(entries, labels)
+        self._search_edit.setPlaceholderText(_SEARCH_PLACEHOLDER)
+        self._search_edit.setEnabled(True)
+        self._search_edit.setFocus()
+
+    def _schedule_filter(self, _text: str) -> None:
+        self._filter_timer.start()
+
+    def _apply_filter(self) -> None:
+        self._filter(self._search_edit.text())
 
     def _filter(self, query: str) -> None:
         q = query.lower()
-        if not q:
-            self._render(self._all_entries)
+        if q == self._last_query:
             return
-        self._render([
-            e for e in self._all_entries
-            if q in (e.title or "").lower()
-            or q in (e.username or "").lower()
-            or q in (e.group.name if e.group else "").lower()
-        ])
+        haystacks = self._haystacks
+        if not q:
+            rows = list(range(len(haystacks)))
+        elif self._last_query in q:
+            # Narrowing: anything the new query matches also matched the
+            # previous one, so only the previous hits need re-testing.
+            rows = [i for i in self._last_rows if q in haystacks[i]]
+        else:
+            rows = [i for i, hay in enumerate(haystacks) if q in hay]
+        self._last_query = q
+        self._last_rows = rows
+        self._model.set_visible(rows)
 
     # ------------------------------------------------------------------
     # Confirmation
     # ------------------------------------------------------------------
 
     def _confirm(self, *_args) -> None:
-        item = self._list.currentItem()
-        if item is None:
+        index = self._list.currentIndex()
+        if not index.isValid():
             return
-        self.selected_entry = item.data(Qt.ItemDataRole.UserRole)
+        self.selected_entry = self._model.entry(index.row())
         self.accept()
@@ -42,7 +42,6 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QListWidget,
-    QListWidgetItem,
     QMessageBox,
     QPushButton,
     QSpinBox,
@@ -60,6 +59,8 @@ class NewSessionDialog(QDialog):
 
     _PROTOCOLS = ["ssh", "rdp", "vnc", "telnet"]
     _DEFAULT_PORTS = {"ssh": 22, "rdp": 3389, "vnc": 5900, "telnet": 23}
+    _SSH_TAB = 1
+    _RDP_TAB = 2
 
     def __init__(
         self,
@@ -88,11 +89,20 @@ class NewSessionDialog(QDialog):
         root.setSpacing(12)
         root.setContentsMargins(20, 20, 20, 20)
 
-        tabs = QTabWidget()
-        tabs.addTab(self._tab_general(), "General")
-        tabs.addTab(self._tab_ssh(), "SSH Options")
-        tabs.addTab(self._tab_rdp(), "RDP Options")
-        root.addWidget(tabs)
+        # The SSH and RDP pages start as empty placeholders and are filled
+        # on first visit; most sessions are saved from the General tab alone.
+        self._tabs = QTabWidget()
+        self._tabs.addTab(self._tab_general(), "General")
+        self._tab_builders = {
+            self._SSH_TAB: self._tab_ssh,
+            self._RDP_TAB: self._tab_rdp,
+        }
+        for title in ("SSH Options", "RDP Options"):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self._tabs.addTab(page, title)
+        self._tabs.currentChanged.connect(self._build_tab)
+        root.addWidget(self._tabs)
 
         # KeePass credential
         kp_grp = QGroupBox("KeePass Credential")
@@ -117,6 +127,11 @@ class NewSessionDialog(QDialog):
         btns.rejected.connect(self.reject)
         root.addWidget(btns)
 
+    def _build_tab(self, index: int) -> None:
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self._tabs.widget(index).layout().addWidget(builder())
+
     # ── General tab ────────────────────────────────────────────────────
 
     def _tab_general(self) -> QWidget:
@@ -140,9 +155,11 @@ class NewSessionDialog(QDialog):
         self._host_edit.setPlaceholderText("192.168.1.1 or hostname")
         form.addRow("Hostname / IP", self._host_edit)
 
-        self._port_edit = QLineEdit("22")
-        self._port_edit.setFixedWidth(80)
-        form.addRow("Port", self._port_edit)
+        self._port_spin = QSpinBox()
+        self._port_spin.setRange(1, 65535)
+        self._port_spin.setValue(22)
+        self._port_spin.setFixedWidth(80)
+        form.addRow("Port", self._port_spin)
 
         self._user_edit = QLineEdit()
         self._user_edit.setPlaceholderText("admin")
@@ -203,6 +220,10 @@ class NewSessionDialog(QDialog):
 
         layout.addWidget(tun_grp)
         layout.addStretch()
+
+        if self._session:
+            self._x11_chk.setChecked(self._session.x11_forwarding)
+        self._refresh_tunnel_list()
         return w
 
     # ── RDP Options tab ────────────────────────────────────────────────
@@ -238,6 +259,12 @@ class NewSessionDialog(QDialog):
         )
         note.setWordWrap(True)
         form.addRow("", note)
+
+        s = self._session
+        if s:
+            self._rdp_w_spin.setValue(s.rdp_width)
+            self._rdp_h_spin.setValue(s.rdp_height)
+            self._rdp_full_chk.setChecked(s.rdp_fullscreen)
         return w
 
     # ------------------------------------------------------------------
@@ -250,20 +277,15 @@ class NewSessionDialog(QDialog):
         if idx >= 0:
             self._proto_combo.setCurrentIndex(idx)
         self._host_edit.setText(s.hostname)
-        self._port_edit.setText(str(s.port))
+        self._port_spin.setValue(s.port)
         self._user_edit.setText(s.username)
         self._key_edit.setText(s.key_path)
         self._folder_edit.setText(s.folder)
-        self._x11_chk.setChecked(s.x11_forwarding)
-        self._rdp_w_spin.setValue(s.rdp_width)
-        self._rdp_h_spin.setValue(s.rdp_height)
-        self._rdp_full_chk.setChecked(s.rdp_fullscreen)
         if s.keepass_entry_uuid:
             entry = keepass_manager.get_entry_by_uuid(s.keepass_entry_uuid)
             self._kp_label.setText(
                 entry.title if entry else f"UUID: {s.keepass_entry_uuid[:8]}…"
             )
-        self._refresh_tunnel_list()
 
     # ------------------------------------------------------------------
     # Actions
@@ -271,13 +293,8 @@ class NewSessionDialog(QDialog):
 
     def _on_proto_changed(self, idx: int) -> None:
         proto = self._proto_combo.itemData(idx) or "ssh"
-        default_port = self._DEFAULT_PORTS.get(proto, 22)
-        try:
-            current = int(self._port_edit.text())
-        except ValueError:
-            current = -1
-        if current in self._DEFAULT_PORTS.values():
-            self._port_edit.setText(str(default_port))
+        if self._port_spin.value() in self._DEFAULT_PORTS.values():
+            self._port_spin.setValue(self._DEFAULT_PORTS.get(proto, 22))
 
     def _browse_key(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
@@ -307,25 +324,40 @@ class NewSessionDialog(QDialog):
 
     def _refresh_tunnel_list(self) -> None:
         self._tunnel_list.clear()
-        for t in self._tunnels:
-            self._tunnel_list.addItem(QListWidgetItem(str(t)))
+        self._tunnel_list.addItems([str(t) for t in self._tunnels])
 
     def _add_tunnel(self) -> None:
         dlg = _TunnelDialog(self)
         if dlg.exec() and dlg.result:
             self._tunnels.append(dlg.result)
-            self._refresh_tunnel_list()
+            self._tunnel_list.addItem(str(dlg.result))
 
     def _remove_tunnel(self) -> None:
         row = self._tunnel_list.currentRow()
         if 0 <= row < len(self._tunnels):
             del self._tunnels[row]
-            self._refresh_tunnel_list()
+            # takeItem hands ownership back to Python; dropping it deletes it
+            self._tunnel_list.takeItem(row)
 
     # ------------------------------------------------------------------
     # Save
     # ------------------------------------------------------------------
 
+    def _option_values(self) -> dict:
+        """Return the SSH/RDP option fields from the tabs that were built.
+
+        Options on a tab the user never opened are left out, so an edited
+        session keeps its stored values and a new one gets the defaults.
+        """
+        values: dict = {}
+        if self._SSH_TAB not in self._tab_builders:
+            values["x11_forwarding"] = self._x11_chk.isChecked()
+        if self._RDP_TAB not in self._tab_builders:
+            values["rdp_width"] = self._rdp_w_spin.value()
+            values["rdp_height"] = self._rdp_h_spin.value()
+            values["rdp_fullscreen"] = self._rdp_full_chk.isChecked()
+        return values
+
     def _save(self) -> None:
         name = self._name_edit.text().strip()
         host = self._host_edit.text().strip()
@@ -336,13 +368,10 @@ class NewSessionDialog(QDialog):
         if not host:
             QMessageBox.warning(self, "Validation", "Hostname is required.")
             return
-        try:
-            port = int(self._port_edit.text())
-        except ValueError:
-            QMessageBox.warning(self, "Validation", "Port must be a number.")
-            return
+        port = self._port_spin.value()
 
         tunnels_dicts = [t.to_dict() for t in self._tunnels]
+        options = self._option_values()
 
         if self._session:
             s = self._session
@@ -354,11 +383,9 @@ class NewSessionDialog(QDialog):
             s.key_path = self._key_edit.text().strip()
             s.folder = self._folder_edit.text().strip()
             s.keepass_entry_uuid = self._kp_uuid
-            s.x11_forwarding = self._x11_chk.isChecked()
             s.local_tunnels = tunnels_dicts
-            s.rdp_width = self._rdp_w_spin.value()
-            s.rdp_height = self._rdp_h_spin.value()
-            s.rdp_fullscreen = self._rdp_full_chk.isChecked()
+            for key, value in options.items():
+                setattr(s, key, value)
             self.result_session = s
         else:
             self.result_session = SSHSessionConfig(
@@ -370,11 +397,8 @@ class NewSessionDialog(QDialog):
                 key_path=self._key_edit.text().strip(),
                 folder=self._folder_edit.text().strip(),
                 keepass_entry_uuid=self._kp_uuid,
-                x11_forwarding=self._x11_chk.isChecked(),
                 local_tunnels=tunnels_dicts,
-                rdp_width=self._rdp_w_spin.value(),
-                rdp_height=self._rdp_h_spin.value(),
-                rdp_fullscreen=self._rdp_full_chk.isChecked(),
+                **options,
             )
         self.accept()
 
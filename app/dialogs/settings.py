@@ -17,11 +17,16 @@ Written by Christopher Malo
 
 from __future__ import annotations
 
+import dataclasses
+import functools
 import pathlib
+import subprocess
+import sys
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QStringListModel, QTimer, Slot
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
+    QAbstractButton,
     QApplication,
     QCheckBox,
     QComboBox,
@@ -33,7 +38,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
+    QListView,
     QPushButton,
     QSpinBox,
     QTabWidget,
@@ -41,23 +46,115 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+import app.browser
+from app.browser.server import browser_server
 from app.constants import THEMES
 from app.managers.settings import settings_manager
 from app.managers.logger import get_logger
 from app.plugins.loader import plugin_loader
+from app.theme import apply_theme
 
 log = get_logger(__name__)
 
+# Unpacked browser extension shipped alongside the app.browser package
+_EXT_DIR = str(pathlib.Path(app.browser.__file__).parent / "extension")
+_EXT_DIR_LABEL = f"Extension folder:  {_EXT_DIR}"
+
+# Platform file-manager command, plus Popen options that detach it from the
+# GUI: own session / process group, no inherited stdio
+if sys.platform == "darwin":
+    _OPEN_CMD = "open"
+    _DETACH: dict = {"start_new_session": True}
+elif sys.platform == "win32":
+    _OPEN_CMD = "explorer"
+    _DETACH = {
+        "creationflags": subprocess.DETACHED_PROCESS
+        | subprocess.CREATE_NEW_PROCESS_GROUP,
+    }
+else:
+    _OPEN_CMD = "xdg-open"
+    _DETACH = {"start_new_session": True}
+
+# Delay (ms) that coalesces repeated Apply clicks into one status refresh
+_STATUS_REFRESH_MS = 50
+
+# Theme name → its row in the theme combo (rows follow THEMES order)
+_THEME_INDEX = {name: i for i, name in enumerate(THEMES)}
+
+
+# Help text for the tabs with bespoke layouts
+_APPEARANCE_HELP = "Theme changes take effect immediately on Apply / OK."
+
+_BROWSER_INSTALL_HELP = (
+    "Chrome / Edge:  chrome://extensions  →  Load unpacked  →  select the folder above.\n"
+    "Firefox:  about:debugging  →  Load Temporary Add-on  →  select manifest.json.\n\n"
+    "Convert icons/icon.svg to PNG before loading "
+    "(see icons/README.txt)."
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class _SpinTab:
+    """A settings tab holding one numeric setting and a help note."""
+
+    key: str
+    label: str
+    minimum: int
+    maximum: int
+    suffix: str
+    help_text: str
+    special: str = ""   # shown instead of the minimum value, if set
+
+
+_TERMINAL_TAB = _SpinTab(
+    "font_size_terminal", "Terminal font size", 8, 28, "  pt",
+    "Font size changes apply to new tabs only.",
+)
+
+_AUTOTYPE_TAB = _SpinTab(
+    "autotype_delay_ms", "Keystroke delay", 0, 1000, "  ms",
+    "Global Auto-Type simulates keystrokes in the currently focused window.\n\n"
+    "Requirements:\n"
+    "  • Linux/X11:  pip install pynput python3-xlib\n"
+    "  • macOS:      pip install pynput  (grant Accessibility permission)\n"
+    "  • Windows:    pip install pynput",
+)
+
+_KEEPASS_TAB = _SpinTab(
+    "clipboard_clear_timeout_s", "Clipboard auto-clear", 0, 120, "  s",
+    "In the KeePass panel:\n"
+    "  Ctrl+U  – copy username of selected entry\n"
+    "  Ctrl+P  – copy password of selected entry\n\n"
+    "After copying, the clipboard is automatically cleared after the\n"
+    "timeout above.  Set to 0 to disable auto-clear.",
+    special="Disabled (0)",
+)
+
+
+def _form_page() -> tuple[QWidget, QFormLayout]:
+    """Return a settings page and its form layout with the standard spacing."""
+    w = QWidget()
+    form = QFormLayout(w)
+    form.setSpacing(12)
+    form.setContentsMargins(16, 16, 16, 16)
+    return w, form
+
 
 class SettingsDialog(QDialog):
     """Application-wide settings with OK / Apply / Cancel."""
 
+    # Tab indices, in display order
+    _APPEARANCE, _TERMINAL, _AUTOTYPE, _KEEPASS, _BROWSER, _PLUGINS = range(6)
+
+    # Icon path → QIcon, shared across dialog instances.  A QIcon keeps the
+    # pixmaps it has rendered, so reusing it avoids decoding the file again.
+    _icon_cache: dict[str, QIcon] = {}
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setMinimumSize(520, 460)
         self._build_ui()
-        self._load()
 
     # ------------------------------------------------------------------
     # UI
@@ -68,21 +165,36 @@ class SettingsDialog(QDialog):
         root.setContentsMargins(16, 16, 16, 16)
         root.setSpacing(12)
 
-        tabs = QTabWidget()
-        tabs.setObjectName("settings-tabs")
-        tabs.addTab(self._tab_appearance(), "Appearance")
-        tabs.addTab(self._tab_terminal(),   "Terminal")
-        tabs.addTab(self._tab_autotype(),   "Auto-Type")
-        tabs.addTab(self._tab_keepass(),    "KeePass")
-        tabs.addTab(self._tab_browser(),    "Browser")
-        tabs.addTab(self._tab_plugins(),    "Plugins")
-        root.addWidget(tabs)
+        # Every page starts as an empty placeholder and is built, with its
+        # fields loaded from settings_manager, the first time it is shown.
+        # Opening the dialog therefore builds one tab and scans no plugins.
+        self._tabs = QTabWidget()
+        self._tabs.setObjectName("settings-tabs")
+        # settings key → spin box, for the single-setting tabs built so far
+        self._spins: dict[str, QSpinBox] = {}
+        spin_tab = self._tab_spin
+        self._tab_builders = {
+            self._APPEARANCE: self._tab_appearance,
+            self._TERMINAL:   functools.partial(spin_tab, _TERMINAL_TAB),
+            self._AUTOTYPE:   functools.partial(spin_tab, _AUTOTYPE_TAB),
+            self._KEEPASS:    functools.partial(spin_tab, _KEEPASS_TAB),
+            self._BROWSER:    self._tab_browser,
+            self._PLUGINS:    self._tab_plugins,
+        }
+        for title in ("Appearance", "Terminal", "Auto-Type", "KeePass",
+                      "Browser", "Plugins"):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self._tabs.addTab(page, title)
+        self._tabs.currentChanged.connect(self._build_tab)
+        self._build_tab(self._tabs.currentIndex())
+        root.addWidget(self._tabs)
 
         # ── Button row: OK | Apply | Cancel ───────────────────────────
         self._btns = QDialogButtonBox()
         ok_btn     = self._btns.addButton(QDialogButtonBox.StandardButton.Ok)
         apply_btn  = self._btns.addButton(QDialogButtonBox.StandardButton.Apply)
-        _cancel    = self._btns.addButton(QDialogButtonBox.StandardButton.Cancel)
+        self._btns.addButton(QDialogButtonBox.StandardButton.Cancel)
 
         ok_btn.setObjectName("primary")
         apply_btn.setObjectName("apply")
@@ -91,17 +203,22 @@ class SettingsDialog(QDialog):
         self._btns.rejected.connect(self.reject)
         root.addWidget(self._btns)
 
+    @Slot(int)
+    def _build_tab(self, index: int) -> None:
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            self._tabs.widget(index).layout().addWidget(builder())
+
+    def _is_built(self, index: int) -> bool:
+        return index not in self._tab_builders
+
     # ── Appearance tab ─────────────────────────────────────────────────
 
     def _tab_appearance(self) -> QWidget:
-        w = QWidget()
-        form = QFormLayout(w)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 16, 16, 16)
+        w, form = _form_page()
 
         self._theme_combo = QComboBox()
-        for name in THEMES:
-            self._theme_combo.addItem(name)
+        self._theme_combo.addItems(list(THEMES))
         form.addRow("Color theme", self._theme_combo)
 
         icon_row = QHBoxLayout()
@@ -110,82 +227,39 @@ class SettingsDialog(QDialog):
         browse_btn = QPushButton("Browse…")
         browse_btn.clicked.connect(self._browse_icon)
         clear_btn = QPushButton("Clear")
-        clear_btn.clicked.connect(lambda: self._icon_edit.clear())
+        clear_btn.clicked.connect(self._icon_edit.clear)
         icon_row.addWidget(self._icon_edit, 1)
         icon_row.addWidget(browse_btn)
         icon_row.addWidget(clear_btn)
         form.addRow("Application icon (.png/.ico)", icon_row)
 
-        note = QLabel("Theme changes take effect immediately on Apply / OK.")
+        note = QLabel(_APPEARANCE_HELP)
         note.setWordWrap(True)
-        form.addRow("", note)
-        return w
-
-    # ── Terminal tab ───────────────────────────────────────────────────
-
-    def _tab_terminal(self) -> QWidget:
-        w = QWidget()
-        form = QFormLayout(w)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 16, 16, 16)
-
-        self._font_spin = QSpinBox()
-        self._font_spin.setRange(8, 28)
-        self._font_spin.setSuffix("  pt")
-        form.addRow("Terminal font size", self._font_spin)
+        form.addRow(note)
 
-        note = QLabel("Font size changes apply to new tabs only.")
-        note.setWordWrap(True)
-        form.addRow("", note)
+        idx = _THEME_INDEX.get(settings_manager.get("theme"))
+        if idx is not None:
+            self._theme_combo.setCurrentIndex(idx)
+        self._icon_edit.setText(settings_manager.get("app_icon"))
         return w
 
-    # ── Auto-Type tab ──────────────────────────────────────────────────
+    # ── Terminal / Auto-Type / KeePass tabs ────────────────────────────
 
-    def _tab_autotype(self) -> QWidget:
-        w = QWidget()
-        form = QFormLayout(w)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 16, 16, 16)
-
-        self._delay_spin = QSpinBox()
-        self._delay_spin.setRange(0, 1000)
-        self._delay_spin.setSuffix("  ms")
-        form.addRow("Keystroke delay", self._delay_spin)
-
-        info = QLabel(
-            "Global Auto-Type simulates keystrokes in the currently focused window.\n\n"
-            "Requirements:\n"
-            "  • Linux/X11:  pip install pynput python3-xlib\n"
-            "  • macOS:      pip install pynput  (grant Accessibility permission)\n"
-            "  • Windows:    pip install pynput"
-        )
-        info.setWordWrap(True)
-        form.addRow("", info)
-        return w
+    def _tab_spin(self, spec: _SpinTab) -> QWidget:
+        w, form = _form_page()
 
-    # ── KeePass tab ────────────────────────────────────────────────────
+        spin = QSpinBox()
+        spin.setRange(spec.minimum, spec.maximum)
+        spin.setSuffix(spec.suffix)
+        if spec.special:
+            spin.setSpecialValueText(spec.special)
+        spin.setValue(settings_manager.get(spec.key))
+        form.addRow(spec.label, spin)
+        self._spins[spec.key] = spin
 
-    def _tab_keepass(self) -> QWidget:
-        w = QWidget()
-        form = QFormLayout(w)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 16, 16, 16)
-
-        self._clip_timeout_spin = QSpinBox()
-        self._clip_timeout_spin.setRange(0, 120)
-        self._clip_timeout_spin.setSuffix("  s")
-        self._clip_timeout_spin.setSpecialValueText("Disabled (0)")
-        form.addRow("Clipboard auto-clear", self._clip_timeout_spin)
-
-        shortcuts_info = QLabel(
-            "In the KeePass panel:\n"
-            "  Ctrl+U  – copy username of selected entry\n"
-            "  Ctrl+P  – copy password of selected entry\n\n"
-            "After copying, the clipboard is automatically cleared after the\n"
-            "timeout above.  Set to 0 to disable auto-clear."
-        )
-        shortcuts_info.setWordWrap(True)
-        form.addRow("", shortcuts_info)
+        note = QLabel(spec.help_text)
+        note.setWordWrap(True)
+        form.addRow(note)
         return w
 
     # ── Browser tab ────────────────────────────────────────────────────
@@ -200,6 +274,7 @@ class SettingsDialog(QDialog):
         self._browser_chk = QCheckBox(
             "Enable browser integration  (starts local HTTP server on save)"
         )
+        self._browser_chk.setChecked(settings_manager.get("browser_integration"))
         layout.addWidget(self._browser_chk)
 
         # ── Port ──────────────────────────────────────────────────────
@@ -207,7 +282,7 @@ class SettingsDialog(QDialog):
         form.setSpacing(10)
         self._browser_port_spin = QSpinBox()
         self._browser_port_spin.setRange(1024, 65535)
-        self._browser_port_spin.setValue(19456)
+        self._browser_port_spin.setValue(settings_manager.get("browser_port"))
         form.addRow("Server port", self._browser_port_spin)
         layout.addLayout(form)
 
@@ -216,28 +291,25 @@ class SettingsDialog(QDialog):
         self._browser_status_lbl.setWordWrap(True)
         layout.addWidget(self._browser_status_lbl)
         self._refresh_browser_status()
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(_STATUS_REFRESH_MS)
+        self._status_timer.timeout.connect(self._refresh_browser_status)
 
         # ── Extension location ────────────────────────────────────────
         ext_box = QGroupBox("Browser extension")
         ext_layout = QVBoxLayout(ext_box)
         ext_layout.setSpacing(6)
 
-        import app.browser  # noqa: PLC0415
-        ext_dir = pathlib.Path(app.browser.__file__).parent / "extension"
-        ext_path_lbl = QLabel(f"Extension folder:  {ext_dir}")
+        ext_path_lbl = QLabel(_EXT_DIR_LABEL)
         ext_path_lbl.setWordWrap(True)
         ext_layout.addWidget(ext_path_lbl)
 
         open_dir_btn = QPushButton("Open extension folder…")
-        open_dir_btn.clicked.connect(lambda: self._open_ext_folder(ext_dir))
+        open_dir_btn.clicked.connect(self._open_ext_folder)
         ext_layout.addWidget(open_dir_btn)
 
-        install_info = QLabel(
-            "Chrome / Edge:  chrome://extensions  →  Load unpacked  →  select the folder above.\n"
-            "Firefox:  about:debugging  →  Load Temporary Add-on  →  select manifest.json.\n\n"
-            "Convert icons/icon.svg to PNG before loading "
-            "(see icons/README.txt)."
-        )
+        install_info = QLabel(_BROWSER_INSTALL_HELP)
         install_info.setWordWrap(True)
         ext_layout.addWidget(install_info)
         layout.addWidget(ext_box)
@@ -245,26 +317,32 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return w
 
+    @Slot()
     def _refresh_browser_status(self) -> None:
-        from app.browser.server import browser_server  # noqa: PLC0415
+        lbl = self._browser_status_lbl
         if browser_server.running:
-            self._browser_status_lbl.setText(
-                f"  ● Server running on 127.0.0.1:{browser_server.port}"
-            )
-            self._browser_status_lbl.setStyleSheet("color: #a6e3a1;")
+            lbl.setText(f"  ● Server running on 127.0.0.1:{browser_server.port}")
+            name = "server-running"
         else:
-            self._browser_status_lbl.setText("  ○ Server not running")
-            self._browser_status_lbl.setStyleSheet("color: #f38ba8;")
-
-    def _open_ext_folder(self, path: pathlib.Path) -> None:
-        import subprocess, sys  # noqa: PLC0415
+            lbl.setText("  ○ Server not running")
+            name = "server-stopped"
+        # Colour comes from the theme stylesheet; re-polish only on a change
+        if lbl.objectName() != name:
+            lbl.setObjectName(name)
+            lbl.style().unpolish(lbl)
+            lbl.style().polish(lbl)
+
+    @Slot()
+    def _open_ext_folder(self) -> None:
         try:
-            if sys.platform == "darwin":
-                subprocess.Popen(["open", str(path)])
-            elif sys.platform == "win32":
-                subprocess.Popen(["explorer", str(path)])
-            else:
-                subprocess.Popen(["xdg-open", str(path)])
+            subprocess.Popen(
+                [_OPEN_CMD, _EXT_DIR],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                **_DETACH,
+            )
         except Exception as exc:
             log.error("Could not open extension folder: %s", exc)
 
@@ -278,62 +356,72 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(QLabel("Plugin directory: ~/.sessionvault/plugins/"))
 
-        self._plugin_list = QListWidget()
-        layout.addWidget(self._plugin_list, 1)
+        self._plugin_model = QStringListModel(self)
+        plugin_view = QListView()
+        plugin_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        plugin_view.setModel(self._plugin_model)
+        layout.addWidget(plugin_view, 1)
 
         reload_btn = QPushButton("Reload plugins")
         reload_btn.clicked.connect(self._reload_plugins)
         layout.addWidget(reload_btn)
 
-        self._reload_plugins()
+        # The main window loads plugins at startup; show that result and
+        # only rescan the plugin directory when the user asks for it.
+        self._show_plugins(plugin_loader.loaded, plugin_loader.errors)
         return w
 
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
 
-    def _load(self) -> None:
-        theme = settings_manager.get("theme", "Catppuccin Mocha")
-        idx = self._theme_combo.findText(theme)
-        if idx >= 0:
-            self._theme_combo.setCurrentIndex(idx)
-        self._icon_edit.setText(settings_manager.get("app_icon", ""))
-        self._font_spin.setValue(settings_manager.get("font_size_terminal", 11))
-        self._delay_spin.setValue(settings_manager.get("autotype_delay_ms", 50))
-        self._clip_timeout_spin.setValue(
-            settings_manager.get("clipboard_clear_timeout_s", 15)
-        )
-        self._browser_chk.setChecked(settings_manager.get("browser_integration", False))
-        self._browser_port_spin.setValue(settings_manager.get("browser_port", 19456))
+    def _tab_values(self) -> dict:
+        """Return the settings shown on the tabs that have been built.
+
+        Settings on a tab the user never opened are left out, so their
+        stored values stand.
+        """
+        values: dict = {}
+        if self._is_built(self._APPEARANCE):
+            values["theme"]    = self._theme_combo.currentText()
+            values["app_icon"] = self._icon_edit.text().strip()
+        for key, spin in self._spins.items():
+            values[key] = spin.value()
+        if self._is_built(self._BROWSER):
+            values["browser_integration"] = self._browser_chk.isChecked()
+            values["browser_port"]        = self._browser_port_spin.value()
+        return values
 
     def _save_settings(self) -> None:
-        """Persist current UI values to settings_manager and apply immediately."""
-        theme_name   = self._theme_combo.currentText()
-        icon_path    = self._icon_edit.text().strip()
-        font_size    = self._font_spin.value()
-        delay        = self._delay_spin.value()
-        clip_timeout = self._clip_timeout_spin.value()
-        browser_on   = self._browser_chk.isChecked()
-        browser_port = self._browser_port_spin.value()
-
-        settings_manager.set("theme",                     theme_name)
-        settings_manager.set("app_icon",                  icon_path)
-        settings_manager.set("font_size_terminal",        font_size)
-        settings_manager.set("autotype_delay_ms",         delay)
-        settings_manager.set("clipboard_clear_timeout_s", clip_timeout)
-        settings_manager.set("browser_integration",       browser_on)
-        settings_manager.set("browser_port",              browser_port)
-
-        from app.theme import apply_theme  # noqa: PLC0415
-        apply_theme(theme_name)
-
+        """Persist changed UI values to settings_manager and apply them.
+
+        Only settings that differ from the stored values are written, and
+        the theme and application icon are only re-applied when changed.
+        """
+        changed = {
+            key: value
+            for key, value in self._tab_values().items()
+            if settings_manager.get(key) != value
+        }
+        settings_manager.update(changed)
+
+        if "theme" in changed:
+            apply_theme(changed["theme"])
+
+        icon_path = changed.get("app_icon")
         if icon_path:
             app = QApplication.instance()
             if app:
-                app.setWindowIcon(QIcon(icon_path))
-
-        # Start / stop / restart browser server to match new settings
-        from app.browser.server import browser_server  # noqa: PLC0415
+                icon = self._icon_cache.get(icon_path)
+                if icon is None:
+                    icon = self._icon_cache[icon_path] = QIcon(icon_path)
+                app.setWindowIcon(icon)
+
+        # Start / stop / restart browser server to match the settings.  This
+        # only acts when the server's state differs from them, which also
+        # retries a server that failed to start on an earlier save.
+        browser_on   = settings_manager.get("browser_integration")
+        browser_port = settings_manager.get("browser_port")
         if browser_on:
             if browser_server.running and browser_server.port != browser_port:
                 browser_server.restart(browser_port)
@@ -346,15 +434,17 @@ class SettingsDialog(QDialog):
         else:
             browser_server.stop()
 
-        self._refresh_browser_status()
+        if self._is_built(self._BROWSER):
+            self._status_timer.start()
 
-        log.info(
-            "Settings saved: theme=%s  font=%dpt  autotype_delay=%dms  "
-            "clip_timeout=%ds  browser=%s:%d",
-            theme_name, font_size, delay, clip_timeout, browser_on, browser_port,
-        )
+        if changed:
+            log.info(
+                "Settings saved: %s",
+                "  ".join(f"{key}={value}" for key, value in changed.items()),
+            )
 
-    def _on_button_clicked(self, btn) -> None:
+    @Slot(QAbstractButton)
+    def _on_button_clicked(self, btn: QAbstractButton) -> None:
         role = self._btns.buttonRole(btn)
         if role == QDialogButtonBox.ButtonRole.AcceptRole:   # OK
             self._save_settings()
@@ -367,24 +457,25 @@ class SettingsDialog(QDialog):
     # Helpers
     # ------------------------------------------------------------------
 
+    @Slot()
     def _browse_icon(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
             self,
             "Choose Application Icon",
             "",
             "Images (*.png *.ico *.jpg *.svg);;All files (*)",
+            # Custom folder icons cost a stat per entry on network mounts
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons,
         )
         if path:
             self._icon_edit.setText(path)
 
+    @Slot()
     def _reload_plugins(self) -> None:
         loaded = plugin_loader.load_all()
-        errors = plugin_loader.errors
-        self._plugin_list.clear()
-        if not loaded and not errors:
-            self._plugin_list.addItem("  (no plugins found)")
-            return
-        for name in loaded:
-            self._plugin_list.addItem(f"  ✓  {name}")
-        for name, err in errors.items():
-            self._plugin_list.addItem(f"  ✗  {name}  — {err}")
+        self._show_plugins(loaded, plugin_loader.errors)
+
+    def _show_plugins(self, loaded: list[str], errors: dict[str, str]) -> None:
+        lines = [f"  ✓  {name}" for name in loaded]
+        lines += [f"  ✗  {name}  — {err}" for name, err in errors.items()]
+        self._plugin_model.setStringList(lines or ["  (no plugins found)"])
@@ -48,6 +48,15 @@ _META_KEYS = frozenset({"subrep", "imgnum"})
 # Session type code for SSH (applies to both formats)
 _SSH_TYPE = "0"
 
+_SECTION_RE = re.compile(r"^\[(.+)\]\s*$")
+_KV_RE      = re.compile(r"^([^=]+?)\s*=\s*(.*?)\s*$")
+
+# First four '#'-separated fields of a session value: #<1>#<2>[#<3>[#<4>]]
+_ENTRY_RE   = re.compile(r"#([^#]*)#([^#]*)(?:#([^#]*))?(?:#([^#]*))?")
+
+# New-format SSH sessions: the field after #<code># starts "<type>%"
+_SSH_PREFIX = _SSH_TYPE + "%"
+
 
 class MobaXtermImporter:
     """Parse MobaXterm ``.mxtsessions`` files into :class:`SSHSessionConfig` objects."""
@@ -60,20 +69,12 @@ class MobaXtermImporter:
         Duplicate session names within the same folder are disambiguated with
         a counter suffix so that no sessions are silently dropped.
         """
-        sessions: list[SSHSessionConfig] = []
-
         try:
-            sections = cls._read_sections(path)
+            sessions = cls._read_sessions(path)
         except Exception as exc:
             log.error("MobaXterm import: could not read '%s': %s", path, exc)
             raise
 
-        for folder, entries in sections.values():
-            for name, value in entries:
-                parsed = cls._parse_entry(name, value, folder)
-                if parsed is not None:
-                    sessions.append(parsed)
-
         log.info(
             "MobaXterm import: %d SSH session(s) parsed from '%s'",
             len(sessions), path,
@@ -85,26 +86,26 @@ class MobaXtermImporter:
     # ------------------------------------------------------------------
 
     @classmethod
-    def _read_sections(
-        cls, path: str
-    ) -> dict[str, tuple[str, list[tuple[str, str]]]]:
-        """Read *path* and return a mapping of::
+    def _read_sessions(cls, path: str) -> list[SSHSessionConfig]:
+        """Stream *path* and return its SSH sessions, grouped by section.
 
-            section_name → (folder_name, [(key, value), …])
-
-        ``folder_name`` comes from ``SubRep=`` inside the section; it falls
-        back to the section name when ``SubRep`` is absent.
+        Each ``key=value`` line is parsed as soon as it is read, so only
+        SSH sessions are kept, never the raw lines or non-SSH entries.
+        The folder is the section's ``SubRep=`` value, falling back to the
+        section name.  ``SubRep`` may follow entries in its section; those
+        already parsed are re-homed when it appears.
 
         Duplicate keys within a section are renamed:
         ``name``, ``name (2)``, ``name (3)``, …
         """
-        # section_name → [folder, entries_list]
+        # section → [folder, sessions]
         sections: dict[str, list] = {}
-        current: str | None = None
+        current: list | None = None
         seen: dict[str, dict[str, int]] = {}   # section → {lower_key → count}
-
-        _section_re = re.compile(r"^\[(.+)\]\s*$")
-        _kv_re      = re.compile(r"^([^=]+?)\s*=\s*(.*?)\s*$")
+        counts: dict[str, int] = {}            # lower_key → count, current section
+        section_match = _SECTION_RE.match
+        kv_match = _KV_RE.match
+        parse_entry = cls._parse_entry
 
         with open(path, encoding="utf-8-sig", errors="replace") as fh:
             for raw_line in fh:
@@ -114,47 +115,51 @@ class MobaXtermImporter:
                     continue
 
                 # ── Section header ─────────────────────────────────────
-                m = _section_re.match(line)
+                m = section_match(line)
                 if m:
-                    current = m.group(1).strip()
-                    if current not in sections:
-                        # [folder_name, entries_list]
-                        sections[current] = [current, []]
-                        seen[current] = {}
+                    name = m.group(1).strip()
+                    current = sections.get(name)
+                    if current is None:
+                        current = sections[name] = [name, []]
+                        seen[name] = {}
+                    counts = seen[name]
                     continue
 
                 if current is None:
                     continue
 
                 # ── Key = value ────────────────────────────────────────
-                m = _kv_re.match(line)
+                m = kv_match(line)
                 if not m:
                     continue
 
-                key   = m.group(1).strip()
-                value = m.group(2)
+                key       = m.group(1).strip()
+                key_lower = key.lower()
+                value     = m.group(2)
 
                 # Capture SubRep as folder name
-                if key.lower() == "subrep":
+                if key_lower == "subrep":
                     folder = value.strip()
                     if folder:
-                        sections[current][0] = folder
+                        current[0] = folder
+                        for session in current[1]:
+                            session.folder = folder
                     continue
 
                 # Skip other metadata keys
-                if key.lower() in _META_KEYS:
+                if key_lower in _META_KEYS:
                     continue
 
                 # Disambiguate duplicate session names
-                key_lower = key.lower()
-                count = seen[current].get(key_lower, 0) + 1
-                seen[current][key_lower] = count
+                count = counts.get(key_lower, 0) + 1
+                counts[key_lower] = count
                 unique_key = key if count == 1 else f"{key} ({count})"
 
-                sections[current][1].append((unique_key, value))
+                parsed = parse_entry(unique_key, value, current[0])
+                if parsed is not None:
+                    current[1].append(parsed)
 
-        # Convert to immutable tuples: section → (folder, entries)
-        return {sec: (data[0], data[1]) for sec, data in sections.items()}
+        return [s for _folder, found in sections.values() for s in found]
 
     # ------------------------------------------------------------------
     # Entry parser  (handles old and new value formats)
@@ -171,32 +176,29 @@ class MobaXtermImporter:
         * Old: ``#<type>#<host>#<port>#<user>#…``   (``#`` separator throughout)
         * New: ``#<code>#<type>%<host>%<port>%<user>%…``  (``%`` after the code)
         """
-        if not value.startswith("#"):
+        # Only the leading fields are matched; long trailing option lists
+        # are never split.
+        m = _ENTRY_RE.match(value)
+        if m is None:
             return None
 
-        parts = value.split("#")
-        # parts[0] is always "" (text before the leading '#')
-        if len(parts) < 3:
-            return None
-
-        second = parts[2]   # everything after #<code>#
+        second = m.group(2)   # field after #<code>#
 
         if "%" in second:
             # ── New format: #<code>#<type>%<host>%<port>%<user>%… ──
-            params       = second.split("%")
-            session_type = params[0]
-            hostname     = params[1] if len(params) > 1 else ""
-            port_str     = params[2] if len(params) > 2 else "22"
-            username     = params[3] if len(params) > 3 else ""
+            if not second.startswith(_SSH_PREFIX):
+                return None
+            params   = second.split("%", 4)
+            hostname = params[1]
+            port_str = params[2] if len(params) > 2 else "22"
+            username = params[3] if len(params) > 3 else ""
         else:
             # ── Old format: #<type>#<host>#<port>#<user>#… ──────────
-            session_type = parts[1]
-            hostname     = parts[2] if len(parts) > 2 else ""
-            port_str     = parts[3] if len(parts) > 3 else "22"
-            username     = parts[4] if len(parts) > 4 else ""
-
-        if session_type != _SSH_TYPE:
-            return None
+            if m.group(1) != _SSH_TYPE:
+                return None
+            hostname = second
+            port_str = m.group(3) or "22"
+            username = m.group(4) or ""
 
         try:
             port = int(port_str)
@@ -23,6 +23,7 @@ Written by Christopher Malo
 from __future__ import annotations
 
 import pathlib
+import uuid
 from collections import defaultdict
 from typing import Optional
 
@@ -49,7 +50,7 @@ from app.managers.settings import settings_manager
 
 log = get_logger(__name__)
 
-# Marker stored in UserRole+1 to distinguish tree node types
+# Node kinds stored on _NodeItem.kind
 _TYPE_GROUP = "group"
 _TYPE_ENTRY = "entry"
 
@@ -60,6 +61,60 @@ _ICON_GROUP   = "\U0001F4C2"   # 📂  open folder
 _ICON_SUBGRP  = "\U0001F4C1"   # 📁  folder
 _ICON_ENTRY   = "\U0001F511"   # 🔑  key
 
+# Combo and tree label fragments, built once rather than per item
+_DB_PREFIX      = f"{_ICON_DB}  "
+_DB_LOCK_PREFIX = f"{_ICON_DB_LOCK}  "
+_LOCKED_SUFFIX  = f"  {_ICON_DB_LOCK}"
+_GROUP_PREFIX   = f"{_ICON_GROUP}  "
+_SUBGRP_PREFIX  = f"{_ICON_SUBGRP}  "
+_ENTRY_PREFIX   = f"{_ICON_ENTRY}  "
+
+# Status-bar names for copyable entry fields
+_FIELD_LABELS = {"username": "Username", "password": "Password", "url": "URL"}
+
+# Typing pause (ms) after which the search filter runs
+_SEARCH_DELAY_MS = 150
+
+# Shorter queries match nearly everything, so they show the full tree
+_MIN_QUERY_LEN = 2
+
+
+def _title_key(entry) -> str:
+    return (entry.title or "").lower()
+
+
+def _name_key(group) -> str:
+    return (group.name or "").lower()
+
+
+class _NodeItem(QTreeWidgetItem):
+    """Tree item holding its group or entry as plain Python attributes.
+
+    Reading ``kind`` and ``payload`` is attribute access; ``item.data()``
+    would cross into Qt and convert the stored object on every call.
+    """
+
+    def __init__(
+        self,
+        parent: Optional[QTreeWidgetItem],
+        label: str,
+        kind: str,
+        payload,
+    ) -> None:
+        if parent is None:
+            super().__init__([label])
+        else:
+            super().__init__(parent, [label])
+        self.kind    = kind
+        self.payload = payload
+
+
+def _entry_of(item: Optional[QTreeWidgetItem]):
+    """Return the entry behind *item*, or None for groups and placeholders."""
+    if isinstance(item, _NodeItem) and item.kind == _TYPE_ENTRY:
+        return item.payload
+    return None
+
 
 class KeePassPanel(QWidget):
     """KeePassXC-style sidebar panel for KeePass database browsing.
@@ -83,6 +138,20 @@ class KeePassPanel(QWidget):
         self._clipboard_timer = QTimer(self)
         self._clipboard_timer.setSingleShot(True)
         self._clipboard_timer.timeout.connect(self._clear_clipboard)
+        # The clipboard lives as long as the QApplication does
+        self._clipboard = QApplication.clipboard()
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(_SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._do_search)
+        # Items of the current tree; groups listed parent-first
+        self._entry_items: list[_NodeItem] = []
+        self._group_items: list[_NodeItem] = []
+        # [(entry item, lowercase "title\0username\0url\0group")]; built on
+        # the first search after each tree rebuild
+        self._search_index: Optional[list] = None
+        self._clipboard_timeout_s = 0
+        self.reload_settings()
         self._build_ui()
         self._install_shortcuts()
 
@@ -169,6 +238,10 @@ class KeePassPanel(QWidget):
         self._rebuild_combo()
         self._rebuild_tree()
 
+    def reload_settings(self) -> None:
+        """Re-read the settings the panel caches (call after they change)."""
+        self._clipboard_timeout_s = settings_manager.get("clipboard_clear_timeout_s", 15)
+
     # ------------------------------------------------------------------
     # Database combo
     # ------------------------------------------------------------------
@@ -179,17 +252,18 @@ class KeePassPanel(QWidget):
         known  = keepass_manager.known_paths
         active = keepass_manager.db_path
         if known:
-            for path in known:
-                locked = keepass_manager.is_path_locked(path)
-                icon   = _ICON_DB_LOCK if locked else _ICON_DB
-                label  = f"{icon}  {pathlib.Path(path).name}"
-                if locked:
-                    label += "  🔒"
+            active_index = -1
+            for i, path in enumerate(known):
+                name = pathlib.Path(path).name
+                if keepass_manager.is_path_locked(path):
+                    label = _DB_LOCK_PREFIX + name + _LOCKED_SUFFIX
+                else:
+                    label = _DB_PREFIX + name
                 self._db_combo.addItem(label, userData=path)
-            for i in range(self._db_combo.count()):
-                if self._db_combo.itemData(i) == active:
-                    self._db_combo.setCurrentIndex(i)
-                    break
+                if path == active:
+                    active_index = i
+            if active_index >= 0:
+                self._db_combo.setCurrentIndex(active_index)
         else:
             self._db_combo.addItem("(no database open)")
         self._db_combo.blockSignals(False)
@@ -210,7 +284,8 @@ class KeePassPanel(QWidget):
             else:
                 # Revert combo to whatever is actually active
                 self._rebuild_combo()
-        else:
+        elif path != keepass_manager.db_path:
+            # Re-picking the active database leaves the tree as it is
             keepass_manager.set_active(path)
             self._rebuild_tree()
             log.debug("KeePass panel switched to database: %s", path)
@@ -220,10 +295,31 @@ class KeePassPanel(QWidget):
     # ------------------------------------------------------------------
 
     def _rebuild_tree(self) -> None:
-        self._tree.clear()
+        self._search_timer.stop()
+        self._search_index = None
         self._search_edit.blockSignals(True)
         self._search_edit.clear()
         self._search_edit.blockSignals(False)
+        self._set_top_level_items(self._build_tree_items())
+
+    def _set_top_level_items(self, items: list[QTreeWidgetItem]) -> None:
+        """Replace the tree contents with *items* in a single insert.
+
+        The items are built detached from the tree, so nothing is laid out
+        or painted until they are all attached at once.
+        """
+        self._tree.setUpdatesEnabled(False)
+        try:
+            self._tree.clear()
+            self._tree.addTopLevelItems(items)
+        finally:
+            self._tree.setUpdatesEnabled(True)
+
+    def _build_tree_items(self) -> list[QTreeWidgetItem]:
+        """Build the detached top-level items for the active database."""
+        top: list[QTreeWidgetItem] = []
+        self._entry_items = []
+        self._group_items = []
 
         if not keepass_manager.is_open:
             # Show locked databases in the tree so the user knows what's there
@@ -232,35 +328,44 @@ class KeePassPanel(QWidget):
             if locked:
                 for p in locked:
                     item = QTreeWidgetItem(
-                        self._tree,
-                        [f"{_ICON_DB_LOCK}  {pathlib.Path(p).name}  — locked"],
+                        [_DB_LOCK_PREFIX + pathlib.Path(p).name + "  — locked"],
                     )
                     item.setFlags(Qt.ItemFlag.NoItemFlags)
                     item.setToolTip(0, f"Click the database name above to unlock\n{p}")
+                    top.append(item)
             else:
-                item = QTreeWidgetItem(self._tree, ["(open a database first)"])
+                item = QTreeWidgetItem(["(open a database first)"])
                 item.setFlags(Qt.ItemFlag.NoItemFlags)
-            return
+                top.append(item)
+            return top
 
         groups  = keepass_manager.get_groups()
         entries = keepass_manager.get_all_entries()
 
-        # Map group UUID string → list of entries
-        group_entries: dict[str, list] = defaultdict(list)
-        for entry in entries:
-            gid = str(entry.group.uuid) if entry.group else "__root__"
-            group_entries[gid].append(entry)
-
-        # Separate root group from child groups
-        root_group   = None
-        child_groups: list = []
+        # Both maps below are keyed by uuid.UUID objects, which hash as they
+        # are; no UUID is ever formatted to a string during the build.
+
+        # Map group UUID → list of entries (None for entries with no group).
+        # One sort up front leaves every group's list in title order.
+        group_entries: dict[Optional[uuid.UUID], list] = {}
+        for entry in sorted(entries, key=_title_key):
+            group = entry.group
+            group_entries.setdefault(
+                group.uuid if group else None, []
+            ).append(entry)
+
+        # Find the root group and index every other group under its parent's
+        # UUID in one pass, each child list sorted by name once.
+        root_group = None
+        children_by_parent: dict[uuid.UUID, list] = defaultdict(list)
         for g in groups:
-            if g.parentgroup is None:
+            parent = g.parentgroup
+            if parent is None:
                 root_group = g
             else:
-                child_groups.append(g)
-
-        child_groups.sort(key=lambda g: (g.name or "").lower())
+                children_by_parent[parent.uuid].append(g)
+        for children in children_by_parent.values():
+            children.sort(key=_name_key)
 
         def _add_group(
             parent_item: Optional[QTreeWidgetItem],
@@ -268,31 +373,18 @@ class KeePassPanel(QWidget):
             depth: int = 0,
         ) -> QTreeWidgetItem:
             gname = group.name or "(unnamed)"
-            icon  = _ICON_GROUP if depth == 0 else _ICON_SUBGRP
-            label = f"{icon}  {gname}"
-
-            if parent_item is None:
-                item = QTreeWidgetItem(self._tree, [label])
-            else:
-                item = QTreeWidgetItem(parent_item, [label])
+            label = (_GROUP_PREFIX if depth == 0 else _SUBGRP_PREFIX) + gname
 
-            item.setData(0, Qt.ItemDataRole.UserRole + 1, _TYPE_GROUP)
-            item.setData(0, Qt.ItemDataRole.UserRole, group)
+            item = _NodeItem(parent_item, label, _TYPE_GROUP, group)
+            self._group_items.append(item)
 
-            # Entries under this group (sorted by title)
-            gid = str(group.uuid)
-            for entry in sorted(
-                group_entries.get(gid, []),
-                key=lambda e: (e.title or "").lower(),
-            ):
+            # Entries under this group (already sorted by title)
+            gid = group.uuid
+            for entry in group_entries.get(gid, ()):
                 self._add_entry_item(item, entry)
 
-            # Direct child sub-groups (sorted by name)
-            direct_children = [
-                g for g in child_groups
-                if g.parentgroup and str(g.parentgroup.uuid) == gid
-            ]
-            for sg in sorted(direct_children, key=lambda g: (g.name or "").lower()):
+            # Direct child sub-groups (already sorted by name)
+            for sg in children_by_parent.get(gid, ()):
                 _add_group(item, sg, depth + 1)
 
             return item
@@ -300,68 +392,100 @@ class KeePassPanel(QWidget):
         if root_group:
             # Add root group's direct entries without a wrapping root node —
             # the database name is already shown in the combo above the tree.
-            root_gid = str(root_group.uuid)
-            for entry in sorted(
-                group_entries.get(root_gid, []),
-                key=lambda e: (e.title or "").lower(),
-            ):
-                self._add_entry_item(self._tree.invisibleRootItem(), entry)
+            root_gid = root_group.uuid
+            for entry in group_entries.get(root_gid, ()):
+                top.append(self._add_entry_item(None, entry))
 
             # Top-level sub-groups of root
-            top_groups = [
-                g for g in child_groups
-                if g.parentgroup and str(g.parentgroup.uuid) == root_gid
-            ]
-            for sg in sorted(top_groups, key=lambda g: (g.name or "").lower()):
-                _add_group(self._tree.invisibleRootItem(), sg, 0)
+            for sg in children_by_parent.get(root_gid, ()):
+                top.append(_add_group(None, sg, 0))
+
+        return top
 
     def _add_entry_item(
         self,
-        parent: QTreeWidgetItem,
+        parent: Optional[QTreeWidgetItem],
         entry,
     ) -> QTreeWidgetItem:
+        """Create an entry item under *parent*, or detached if it is None."""
         title    = entry.title    or "(no title)"
         username = entry.username or ""
-        item = QTreeWidgetItem(parent, [f"{_ICON_ENTRY}  {title}"])
+        label    = _ENTRY_PREFIX + title
+        item     = _NodeItem(parent, label, _TYPE_ENTRY, entry)
         # Username shown as a tooltip to keep the row tidy
         if username:
             item.setToolTip(0, f"Username: {username}\n{entry.url or ''}")
-        item.setData(0, Qt.ItemDataRole.UserRole,     entry)
-        item.setData(0, Qt.ItemDataRole.UserRole + 1, _TYPE_ENTRY)
+        self._entry_items.append(item)
         return item
 
     # ------------------------------------------------------------------
     # Search
     # ------------------------------------------------------------------
 
-    def _on_search(self, query: str) -> None:
-        if not query.strip():
-            self._rebuild_tree()
-            return
-        q = query.lower()
-        self._tree.clear()
-        if not keepass_manager.is_open:
+    def _on_search(self, _query: str) -> None:
+        # Coalesce keystrokes; _do_search runs once typing pauses
+        self._search_timer.start()
+
+    def _do_search(self) -> None:
+        query = self._search_edit.text()
+        if len(query.strip()) < _MIN_QUERY_LEN:
+            # Short queries match nearly everything; show the whole tree
+            self._apply_filter(None)
+            if query.strip():
+                self._status(f"Type at least {_MIN_QUERY_LEN} characters to search.")
             return
-        for entry in keepass_manager.get_all_entries():
-            if (
-                q in (entry.title    or "").lower()
-                or q in (entry.username or "").lower()
-                or q in (entry.url      or "").lower()
-                or (entry.group and q in (entry.group.name or "").lower())
-            ):
-                self._add_entry_item(self._tree.invisibleRootItem(), entry)
+        self._apply_filter(query.lower())
+
+    def _apply_filter(self, q: Optional[str]) -> None:
+        """Hide the tree items that do not match *q*; None shows them all.
+
+        The tree is filtered in place, so the group hierarchy is kept and
+        no items are destroyed or re-created per keystroke.  Groups are
+        hidden when nothing under them matches and expanded otherwise.
+        """
+        if q is not None and self._search_index is None:
+            # One string per entry makes each keystroke a single substring
+            # test; the NUL separator stops a match spanning two fields.
+            self._search_index = []
+            for item in self._entry_items:
+                entry = item.payload
+                self._search_index.append((
+                    item,
+                    f"{entry.title or ''}\0{entry.username or ''}\0"
+                    f"{entry.url or ''}\0"
+                    f"{(entry.group.name or '') if entry.group else ''}".lower(),
+                ))
+
+        self._tree.setUpdatesEnabled(False)
+        try:
+            if q is None:
+                for item in self._entry_items:
+                    item.setHidden(False)
+                for item in self._group_items:
+                    item.setHidden(False)
+                return
+
+            for item, haystack in self._search_index:
+                item.setHidden(q not in haystack)
+            # Sub-groups follow their parent in _group_items, so walking it
+            # backwards settles every child before the group containing it.
+            for group in reversed(self._group_items):
+                visible = any(
+                    not group.child(i).isHidden()
+                    for i in range(group.childCount())
+                )
+                group.setHidden(not visible)
+                if visible:
+                    group.setExpanded(True)
+        finally:
+            self._tree.setUpdatesEnabled(True)
 
     # ------------------------------------------------------------------
     # Context menu
     # ------------------------------------------------------------------
 
     def _on_context_menu(self, pos) -> None:
-        item = self._tree.itemAt(pos)
-        if item is None:
-            return
-        if item.data(0, Qt.ItemDataRole.UserRole + 1) != _TYPE_ENTRY:
-            return
-        entry = item.data(0, Qt.ItemDataRole.UserRole)
+        entry = _entry_of(self._tree.itemAt(pos))
         if entry is None:
             return
 
@@ -386,22 +510,16 @@ class KeePassPanel(QWidget):
         menu.exec(self._tree.viewport().mapToGlobal(pos))
 
     def _on_double_click(self, item: QTreeWidgetItem, _col: int) -> None:
-        if item.data(0, Qt.ItemDataRole.UserRole + 1) == _TYPE_ENTRY:
-            entry = item.data(0, Qt.ItemDataRole.UserRole)
-            if entry:
-                self._copy_entry_field(entry, "password")
+        entry = _entry_of(item)
+        if entry:
+            self._copy_entry_field(entry, "password")
 
     # ------------------------------------------------------------------
     # Clipboard helpers
     # ------------------------------------------------------------------
 
     def _selected_entry(self):
-        item = self._tree.currentItem()
-        if item is None:
-            return None
-        if item.data(0, Qt.ItemDataRole.UserRole + 1) != _TYPE_ENTRY:
-            return None
-        return item.data(0, Qt.ItemDataRole.UserRole)
+        return _entry_of(self._tree.currentItem())
 
     def _copy_username(self) -> None:
         entry = self._selected_entry()
@@ -415,10 +533,9 @@ class KeePassPanel(QWidget):
 
     def _copy_entry_field(self, entry, field: str) -> None:
         value = getattr(entry, field, "") or ""
-        QApplication.clipboard().setText(value)
-        label_map = {"username": "Username", "password": "Password", "url": "URL"}
-        label = label_map.get(field, field.title())
-        timeout_s: int = settings_manager.get("clipboard_clear_timeout_s", 15)
+        self._clipboard.setText(value)
+        label = _FIELD_LABELS.get(field) or field.title()
+        timeout_s = self._clipboard_timeout_s
         if timeout_s > 0:
             self._status(f"{label} copied — clipboard clears in {timeout_s}s")
             self._clipboard_timer.stop()
@@ -429,7 +546,7 @@ class KeePassPanel(QWidget):
             log.debug("Clipboard set (%s); auto-clear disabled", label)
 
     def _clear_clipboard(self) -> None:
-        QApplication.clipboard().clear()
+        self._clipboard.clear()
         self._status("Clipboard cleared.")
         log.debug("Clipboard auto-cleared by timer")
 
@@ -18,15 +18,16 @@ from __future__ import annotations
 
 from typing import Callable, Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
+    QFormLayout,
     QHBoxLayout,
     QInputDialog,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QLineEdit,
+    QListView,
     QMessageBox,
     QPushButton,
     QVBoxLayout,
@@ -35,6 +36,58 @@ from PySide6.QtWidgets import (
 from app.macros.manager import macro_manager
 
 
+class _MacroListModel(QAbstractListModel):
+    """Flat list model over macro names.
+
+    Only the names are held; each label is formatted the first time the
+    view asks for that row and cached, since views repeat the request on
+    every repaint.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._names: list[str] = []
+        self._labels: dict[str, str] = {}
+
+    def set_names(self, names: list[str]) -> None:
+        self.beginResetModel()
+        self._names = names
+        self._labels.clear()
+        self.endResetModel()
+
+    def name(self, row: int) -> str:
+        return self._names[row]
+
+    def rename_row(self, row: int, name: str) -> None:
+        self._labels.pop(self._names[row], None)
+        self._names[row] = name
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._labels.pop(self._names.pop(row), None)
+        self.endRemoveRows()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self._names[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            label = self._labels.get(name)
+            if label is None:
+                label = self._labels[name] = (
+                    f"{name}  ({len(macro_manager.get(name))} step(s))"
+                )
+            return label
+        if role == Qt.ItemDataRole.UserRole:
+            return name
+        return None
+
+
 class MacroManagerDialog(QDialog):
     """Browse saved macros and optionally play one into a terminal."""
 
@@ -48,7 +101,6 @@ class MacroManagerDialog(QDialog):
         self.setWindowTitle("Macro Manager")
         self.setMinimumSize(480, 360)
         self._build_ui()
-        self._refresh()
 
     # ------------------------------------------------------------------
     # UI
@@ -61,8 +113,13 @@ class MacroManagerDialog(QDialog):
 
         root.addWidget(QLabel("Saved macros  (double-click to play):"))
 
-        self._list = QListWidget()
-        self._list.itemDoubleClicked.connect(self._play)
+        self._model = _MacroListModel(self)
+        self._list = QListView()
+        self._list.setUniformItemSizes(True)
+        self._list.setLayoutMode(QListView.LayoutMode.Batched)
+        self._list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self._list.setModel(self._model)
+        self._list.doubleClicked.connect(self._play)
         root.addWidget(self._list, 1)
 
         btn_row = QHBoxLayout()
@@ -89,20 +146,25 @@ class MacroManagerDialog(QDialog):
         btns.rejected.connect(self.reject)
         root.addWidget(btns)
 
+    def showEvent(self, event) -> None:
+        # Callers keep one dialog and re-open it; load macros saved since
+        self._refresh()
+        super().showEvent(event)
+
     # ------------------------------------------------------------------
     # Data
     # ------------------------------------------------------------------
 
     def _refresh(self) -> None:
-        self._list.clear()
-        for name, cmds in macro_manager.all().items():
-            item = QListWidgetItem(f"{name}  ({len(cmds)} step(s))")
-            item.setData(Qt.ItemDataRole.UserRole, name)
-            self._list.addItem(item)
+        self._model.set_names(list(macro_manager.all()))
+
+    def _current_row(self) -> int:
+        index = self._list.currentIndex()
+        return index.row() if index.isValid() else -1
 
     def _current_name(self) -> Optional[str]:
-        item = self._list.currentItem()
-        return item.data(Qt.ItemDataRole.UserRole) if item else None
+        row = self._current_row()
+        return self._model.name(row) if row >= 0 else None
 
     # ------------------------------------------------------------------
     # Actions
@@ -114,26 +176,37 @@ class MacroManagerDialog(QDialog):
             return
         cmds = macro_manager.get(name)
         if self._on_play:
-            self._on_play(cmds)
+            # Run once the dialog has closed so a long macro never holds it
+            on_play = self._on_play
+            QTimer.singleShot(0, lambda: on_play(cmds))
         self.accept()
 
     def _rename(self) -> None:
-        name = self._current_name()
-        if not name:
+        row = self._current_row()
+        if row < 0:
             return
+        name = self._model.name(row)
         new_name, ok = QInputDialog.getText(
             self, "Rename Macro", "New name:", text=name
         )
-        if ok and new_name.strip() and new_name.strip() != name:
-            cmds = macro_manager.get(name)
-            macro_manager.delete_macro(name)
-            macro_manager.save_macro(new_name.strip(), cmds)
-            self._refresh()
+        new_name = new_name.strip()
+        if ok and new_name and new_name != name:
+            if new_name in macro_manager.all():
+                QMessageBox.warning(
+                    self, "Rename Macro",
+                    f"A macro named '{new_name}' already exists.",
+                )
+            elif macro_manager.rename(name, new_name):
+                self._model.rename_row(row, new_name)
+            else:
+                # The macro was removed elsewhere; show what is left
+                self._refresh()
 
     def _delete(self) -> None:
-        name = self._current_name()
-        if not name:
+        row = self._current_row()
+        if row < 0:
             return
+        name = self._model.name(row)
         reply = QMessageBox.question(
             self,
             "Delete Macro",
@@ -142,7 +215,7 @@ class MacroManagerDialog(QDialog):
         )
         if reply == QMessageBox.StandardButton.Yes:
             macro_manager.delete_macro(name)
-            self._refresh()
+            self._model.remove_row(row)
 
 
 class MacroSaveDialog(QDialog):
@@ -156,7 +229,6 @@ class MacroSaveDialog(QDialog):
         self._build_ui()
 
     def _build_ui(self) -> None:
-        from PySide6.QtWidgets import QFormLayout, QLineEdit
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
         root.setSpacing(12)
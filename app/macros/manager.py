@@ -10,7 +10,8 @@ Usage::
 
     macro_manager.save_macro("Deploy", ["cd /app", "git pull", "systemctl restart myapp"])
     commands = macro_manager.get("Deploy")   # ["cd /app", ...]
-    macro_manager.delete_macro("Deploy")
+    macro_manager.rename("Deploy", "Release")
+    macro_manager.delete_macro("Release")
 
 JSON format::
 
@@ -24,9 +25,12 @@ Written by Christopher Malo
 
 from __future__ import annotations
 
-import json
+import functools
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
 
 from app.constants import DATA_DIR, MACROS_FILE
+from app.managers._jsonio import atomic_write, dumps, loads
 
 
 class MacroManager:
@@ -35,6 +39,13 @@ class MacroManager:
     def __init__(self) -> None:
         # {macro_name: [cmd_str, ...]}
         self._macros: dict[str, list[str]] = {}
+        self._view: Mapping[str, list[str]] = MappingProxyType(self._macros)
+        # hash() of the bytes last read from or written to MACROS_FILE, and
+        # the file's (mtime_ns, size) at that point
+        self._last_hash = 0
+        self._last_stamp: Optional[tuple[int, int]] = None
+        self._names: Optional[list[str]] = None   # sorted, until a mutation
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
         self._load()
 
     # ------------------------------------------------------------------
@@ -42,40 +53,88 @@ class MacroManager:
     # ------------------------------------------------------------------
 
     def _load(self) -> None:
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
         if MACROS_FILE.exists():
+            # Fill the dict in place; all() hands out a view of it
             try:
-                with open(MACROS_FILE, "r", encoding="utf-8") as fh:
-                    self._macros = json.load(fh)
+                data = MACROS_FILE.read_bytes()
+                self._macros.update(loads(data))
+                self._last_hash = hash(data)
+                self._last_stamp = self._file_stamp()
             except Exception:
-                self._macros = {}
+                self._macros.clear()
 
     def _save(self) -> None:
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
-        with open(MACROS_FILE, "w", encoding="utf-8") as fh:
-            json.dump(self._macros, fh, indent=2)
+        # Serialise up front so an unchanged file can be skipped, unless it
+        # was deleted or replaced on disk since it was last read or written
+        data = dumps(self._macros)
+        data_hash = hash(data)
+        if (data_hash == self._last_hash
+                and self._file_stamp() == self._last_stamp):
+            return
+        atomic_write(MACROS_FILE, data)
+        self._last_hash = data_hash
+        self._last_stamp = self._file_stamp()
+
+    @staticmethod
+    def _file_stamp() -> Optional[tuple[int, int]]:
+        try:
+            st = MACROS_FILE.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _changed(self) -> None:
+        """Drop derived caches and persist a mutation."""
+        self._names = None
+        self._save()
 
     # ------------------------------------------------------------------
     # CRUD
     # ------------------------------------------------------------------
 
-    def all(self) -> dict[str, list[str]]:
-        return dict(self._macros)
+    def all(self) -> Mapping[str, list[str]]:
+        """Return a live, read-only view of every macro."""
+        return self._view
 
-    def get(self, name: str) -> list[str]:
-        return list(self._macros.get(name, []))
+    def get(self, name: str) -> Sequence[str]:
+        """Return the commands of *name*; the stored list, do not mutate."""
+        return self._macros.get(name, ())
 
     def save_macro(self, name: str, commands: list[str]) -> None:
         self._macros[name] = list(commands)
-        self._save()
+        self._changed()
 
     def delete_macro(self, name: str) -> None:
         self._macros.pop(name, None)
-        self._save()
+        self._changed()
+
+    def rename(self, old: str, new: str) -> bool:
+        """Rename macro *old* to *new* in one write.
+
+        Returns False, changing nothing, if *old* does not exist or *new*
+        is already taken.
+        """
+        if old not in self._macros or new in self._macros:
+            return False
+        self._macros[new] = self._macros.pop(old)
+        self._changed()
+        return True
 
     def names(self) -> list[str]:
-        return sorted(self._macros)
+        """Return the macro names sorted; the cached list, do not mutate."""
+        if self._names is None:
+            self._names = sorted(self._macros)
+        return self._names
+
+
+# Global singleton, created on first access rather than at import so that
+# importing this module does no disk I/O
+@functools.cache
+def get_macro_manager() -> MacroManager:
+    return MacroManager()
 
 
-# Global singleton
-macro_manager = MacroManager()
+def __getattr__(name: str):
+    if name == "macro_manager":
+        return get_macro_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
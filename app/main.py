@@ -93,6 +93,7 @@ class SessionVaultApp(QMainWindow):
 
         self._session_mgr = SessionManager()
         self._terminals: dict[str, SSHTerminalWidget] = {}  # session_id → widget
+        self._macro_dlg = None  # MacroManagerDialog, built on first open
 
         self._build_ui()
         self._build_menu()
@@ -625,9 +626,10 @@ class SessionVaultApp(QMainWindow):
     # ------------------------------------------------------------------
 
     def _open_macro_manager(self) -> None:
-        from app.macros.dialog import MacroManagerDialog  # noqa: PLC0415
-        dlg = MacroManagerDialog(self)
-        dlg.exec()
+        if self._macro_dlg is None:
+            from app.macros.dialog import MacroManagerDialog  # noqa: PLC0415
+            self._macro_dlg = MacroManagerDialog(self)
+        self._macro_dlg.exec()
 
     # ------------------------------------------------------------------
     # Browser integration
@@ -640,7 +642,10 @@ class SessionVaultApp(QMainWindow):
         # Browser tab is index 4 (Appearance=0 Terminal=1 AutoType=2 KeePass=3 Browser=4)
         dlg.findChild(__import__("PySide6.QtWidgets", fromlist=["QTabWidget"]).QTabWidget
                       ).setCurrentIndex(4)
-        if dlg.exec():
+        accepted = dlg.exec()
+        # Apply may have saved settings even if the dialog was cancelled
+        self._kp_panel.reload_settings()
+        if accepted:
             icon_path = settings_manager.get("app_icon", "")
             if icon_path:
                 self.setWindowIcon(QIcon(icon_path))
@@ -653,7 +658,9 @@ class SessionVaultApp(QMainWindow):
     def _open_settings(self) -> None:
         from app.dialogs.settings import SettingsDialog  # noqa: PLC0415
         dlg = SettingsDialog(self)
-        if dlg.exec():
+        accepted = dlg.exec()
+        self._kp_panel.reload_settings()
+        if accepted:
             icon_path = settings_manager.get("app_icon", "")
             if icon_path:
                 self.setWindowIcon(QIcon(icon_path))
@@ -0,0 +1,48 @@
+"""JSON file helpers shared by the persistence managers.
+
+``loads``/``dumps`` use orjson when it is installed and fall back to the
+standard library otherwise; the file format is the same either way
+(UTF-8, two-space indent).  :func:`atomic_write` replaces a file so that a
+crash mid-write always leaves either the old or the new contents on disk.
+
+Written by Christopher Malo
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    loads = orjson.loads
+except ImportError:
+    def dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    loads = json.loads
+
+# Flush file data without a separate timestamp update where supported
+_sync = getattr(os, "fdatasync", os.fsync)
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write *data* to a sibling ``.tmp`` file in one call, sync it, and
+    move it over *path*."""
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+        fh.flush()
+        _sync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """Serialise *data* and write it to *path* with :func:`atomic_write`."""
+    atomic_write(path, dumps(data))
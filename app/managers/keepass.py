@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import threading
 import uuid
+from operator import itemgetter
 from typing import TYPE_CHECKING, Optional
 
 from app.managers.logger import get_logger
@@ -41,6 +42,14 @@ class KeePassManager:
         self._dbs: dict[str, "PyKeePass"] = {}  # path → db instance
         self._active_path: str = ""
         self._known_paths: list[str] = []        # paths seen this session (survive lock)
+        # Per-database lookup caches, built lazily and dropped by _invalidate()
+        # whenever that database changes:
+        #   path → all entries (one walk of the kdbx tree)
+        self._entries_cache: dict[str, list] = {}
+        #   path → (host → [(pos, entry)], parent domain → [(pos, entry)])
+        self._host_index: dict[str, tuple[dict, dict]] = {}
+        #   path → {UUID → entry}
+        self._uuid_index: dict[str, dict] = {}
         self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
@@ -104,6 +113,36 @@ class KeePassManager:
         """Return the active :class:`PyKeePass` instance (caller holds lock)."""
         return self._dbs.get(self._active_path)
 
+    def _entries(self, path: str) -> list:
+        """Cached entry list of the open database *path* (caller holds lock)."""
+        entries = self._entries_cache.get(path)
+        if entries is None:
+            entries = self._entries_cache[path] = list(self._dbs[path].entries)
+        return entries
+
+    def _find_by_uuid(self, path: str, uuid_str: str):
+        """Entry with *uuid_str* in open database *path*, or None (caller holds lock).
+
+        Raises ValueError for a malformed UUID string.
+        """
+        index = self._uuid_index.get(path)
+        if index is None:
+            index = self._uuid_index[path] = {
+                e.uuid: e for e in self._entries(path)
+            }
+        return index.get(uuid.UUID(uuid_str))
+
+    def _invalidate(self, path: str = "") -> None:
+        """Drop cached lookups for *path*, or for every database (caller holds lock)."""
+        if path:
+            self._entries_cache.pop(path, None)
+            self._host_index.pop(path, None)
+            self._uuid_index.pop(path, None)
+        else:
+            self._entries_cache.clear()
+            self._host_index.clear()
+            self._uuid_index.clear()
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -123,6 +162,7 @@ class KeePassManager:
         db = _KP(path, password=password or None, keyfile=keyfile or None)
         with self._lock:
             self._dbs[path] = db
+            self._invalidate(path)
             self._active_path = path
             if path not in self._known_paths:
                 self._known_paths.append(path)
@@ -139,6 +179,7 @@ class KeePassManager:
             if path not in self._dbs:
                 return
             self._dbs.pop(path)
+            self._invalidate(path)
             if path not in self._known_paths:
                 self._known_paths.append(path)
             if self._active_path == path:
@@ -179,6 +220,7 @@ class KeePassManager:
 
         with self._lock:
             self._dbs[path] = db
+            self._invalidate(path)
             self._active_path = path
             if path not in self._known_paths:
                 self._known_paths.append(path)
@@ -193,6 +235,7 @@ class KeePassManager:
                 if p not in self._known_paths:
                     self._known_paths.append(p)
             self._dbs.clear()
+            self._invalidate()
             self._active_path = ""
         log.info("All KeePass databases locked (%d db(s) cleared)", count)
 
@@ -213,10 +256,16 @@ class KeePassManager:
     # ------------------------------------------------------------------
 
     def get_all_entries(self, path: str = "") -> list:
-        """All entries in the active (or specified) database."""
+        """All entries in the active (or specified) database.
+
+        The kdbx tree is walked once and cached until the database changes;
+        each call returns a fresh copy of the cached list.
+        """
         with self._lock:
-            db = self._dbs.get(path or self._active_path)
-            return list(db.entries) if db else []
+            path = path or self._active_path
+            if path not in self._dbs:
+                return []
+            return list(self._entries(path))
 
     def get_groups(self, path: str = "") -> list:
         """All groups in the active (or specified) database."""
@@ -227,17 +276,13 @@ class KeePassManager:
     def get_entry_by_uuid(self, uuid_str: str, path: str = ""):
         """Find an entry by UUID string in the active (or specified) database."""
         with self._lock:
-            db = self._dbs.get(path or self._active_path)
-            if db is None:
+            path = path or self._active_path
+            if path not in self._dbs:
                 return None
             try:
-                target = uuid.UUID(uuid_str)
-                for entry in db.entries:
-                    if entry.uuid == target:
-                        return entry
+                return self._find_by_uuid(path, uuid_str)
             except Exception:
-                pass
-            return None
+                return None
 
     def find_entries_for_url(self, url: str) -> list:
         """Return entries whose stored URL hostname matches *url*'s hostname.
@@ -248,7 +293,15 @@ class KeePassManager:
         """
         from urllib.parse import urlparse  # noqa: PLC0415
 
-        req_host = (urlparse(url).hostname or "").lower()
+        return self.find_entries_for_host(urlparse(url).hostname or "")
+
+    def find_entries_for_host(self, host: str) -> list:
+        """Like :meth:`find_entries_for_url` for an already-parsed hostname.
+
+        Served from a per-database hostname index, so a lookup costs a few
+        dict hits rather than a URL parse of every entry.
+        """
+        req_host = host.lower()
         if not req_host:
             return []
 
@@ -256,16 +309,21 @@ class KeePassManager:
             db = self._active_db()
             if db is None:
                 return []
-            matches = []
-            for entry in db.entries:
-                entry_host = (urlparse(entry.url or "").hostname or "").lower()
-                if entry_host and (
-                    entry_host == req_host
-                    or req_host.endswith("." + entry_host)
-                    or entry_host.endswith("." + req_host)
-                ):
-                    matches.append(entry)
-            return matches
+            index = self._host_index.get(self._active_path)
+            if index is None:
+                index = self._host_index[self._active_path] = _build_host_index(
+                    self._entries(self._active_path)
+                )
+            by_host, by_parent = index
+            # Same host, entries on a subdomain of it, and entries on any
+            # parent domain of the requested host.
+            hits = by_host.get(req_host, []) + by_parent.get(req_host, [])
+            dot = req_host.find(".")
+            while dot >= 0:
+                hits += by_host.get(req_host[dot + 1:], ())
+                dot = req_host.find(".", dot + 1)
+            hits.sort(key=itemgetter(0))   # keep database order
+            return [entry for _pos, entry in hits]
 
     def get_password_for_session(self, session: "SSHSessionConfig") -> Optional[str]:
         """Return the KeePass password linked to *session*, or None.
@@ -313,6 +371,8 @@ class KeePassManager:
                 group, title, username, password,
                 url=url or None, notes=notes or None,
             )
+            # The tree has changed even if the save below fails
+            self._invalidate(self._active_path)
             db.save()
             log.info("KeePass entry added: %s / %s", group_name, title)
             return entry
@@ -333,22 +393,22 @@ class KeePassManager:
             if db is None:
                 return False
             try:
-                target = uuid.UUID(uuid_str)
-                for entry in db.entries:
-                    if entry.uuid == target:
-                        if title is not None:
-                            entry.title = title
-                        if username is not None:
-                            entry.username = username
-                        if password is not None:
-                            entry.password = password
-                        if url is not None:
-                            entry.url = url
-                        if notes is not None:
-                            entry.notes = notes
-                        db.save()
-                        log.info("KeePass entry updated: %s", uuid_str)
-                        return True
+                entry = self._find_by_uuid(self._active_path, uuid_str)
+                if entry is not None:
+                    if title is not None:
+                        entry.title = title
+                    if username is not None:
+                        entry.username = username
+                    if password is not None:
+                        entry.password = password
+                    if url is not None:
+                        entry.url = url
+                    if notes is not None:
+                        entry.notes = notes
+                    self._invalidate(self._active_path)
+                    db.save()
+                    log.info("KeePass entry updated: %s", uuid_str)
+                    return True
             except Exception as exc:
                 log.error("Error updating entry %s: %s", uuid_str, exc)
             return False
@@ -360,17 +420,42 @@ class KeePassManager:
             if db is None:
                 return False
             try:
-                target = uuid.UUID(uuid_str)
-                for entry in list(db.entries):
-                    if entry.uuid == target:
-                        db.delete_entry(entry)
-                        db.save()
-                        log.info("KeePass entry deleted: %s", uuid_str)
-                        return True
+                entry = self._find_by_uuid(self._active_path, uuid_str)
+                if entry is not None:
+                    db.delete_entry(entry)
+                    self._invalidate(self._active_path)
+                    db.save()
+                    log.info("KeePass entry deleted: %s", uuid_str)
+                    return True
             except Exception as exc:
                 log.error("Error deleting entry %s: %s", uuid_str, exc)
             return False
 
 
+def _build_host_index(entries: list) -> tuple[dict, dict]:
+    """Index *entries* by URL hostname for :meth:`find_entries_for_host`.
+
+    Returns ``(by_host, by_parent)``: ``by_host`` maps each entry's own
+    hostname, ``by_parent`` maps every parent domain of it (``example.com``
+    and ``com`` for ``login.example.com``).  Values are ``(position, entry)``
+    pairs so results can be returned in database order.
+    """
+    from urllib.parse import urlparse  # noqa: PLC0415
+
+    by_host: dict[str, list] = {}
+    by_parent: dict[str, list] = {}
+    for pos, entry in enumerate(entries):
+        entry_host = (urlparse(entry.url or "").hostname or "").lower()
+        if not entry_host:
+            continue
+        item = (pos, entry)
+        by_host.setdefault(entry_host, []).append(item)
+        dot = entry_host.find(".")
+        while dot >= 0:
+            by_parent.setdefault(entry_host[dot + 1:], []).append(item)
+            dot = entry_host.find(".", dot + 1)
+    return by_host, by_parent
+
+
 # Global singleton shared across the application
 keepass_manager = KeePassManager()
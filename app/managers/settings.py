@@ -20,16 +20,17 @@ Usage::
 
     theme = settings_manager.get("theme", "Catppuccin Mocha")
     settings_manager.set("theme", "Dracula")
+    settings_manager.update({"font_size_terminal": 12, "browser_port": 19457})
 
 Written by Christopher Malo
 """
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from app.constants import DATA_DIR, SETTINGS_FILE
+from app.managers._jsonio import atomic_write_json, loads
 
 
 class SettingsManager:
@@ -59,16 +60,13 @@ class SettingsManager:
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         if SETTINGS_FILE.exists():
             try:
-                with open(SETTINGS_FILE, "r", encoding="utf-8") as fh:
-                    stored = json.load(fh)
-                self._data.update(stored)
+                self._data.update(loads(SETTINGS_FILE.read_bytes()))
             except Exception:
                 pass
 
     def save(self) -> None:
         DATA_DIR.mkdir(parents=True, exist_ok=True)
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as fh:
-            json.dump(self._data, fh, indent=2)
+        atomic_write_json(SETTINGS_FILE, self._data)
 
     # ------------------------------------------------------------------
     # Access
@@ -83,6 +81,12 @@ class SettingsManager:
         self._data[key] = value
         self.save()
 
+    def update(self, values: dict[str, Any]) -> None:
+        """Set several keys and write the file once (not at all if empty)."""
+        if values:
+            self._data.update(values)
+            self.save()
+
 
 # Global singleton
 settings_manager = SettingsManager()
@@ -23,6 +23,7 @@ from __future__ import annotations
 import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
 from typing import Callable
 
 from app.constants import PLUGINS_DIR
@@ -86,24 +87,40 @@ class PluginLoader:
         self.api = PluginAPI()
         self._loaded: list[str] = []
         self._errors: dict[str, str] = {}
+        # path → ((mtime_ns, size), module) for every plugin imported so far
+        self._modules: dict[Path, tuple[tuple[int, int], ModuleType]] = {}
 
     def load_all(self) -> list[str]:
-        """Load all plugins.  Returns list of successfully loaded plugin names."""
+        """Load all plugins.  Returns list of successfully loaded plugin names.
+
+        Each call starts a fresh :class:`PluginAPI` and runs every plugin's
+        ``setup()`` against it, so reloading never duplicates hooks or menu
+        actions.  Plugin files unchanged since the previous call are not
+        re-imported; their cached module is set up again.  Modules of
+        deleted plugin files are dropped from the cache.
+        """
         PLUGINS_DIR.mkdir(parents=True, exist_ok=True)
+        self.api = PluginAPI()
         self._loaded = []
         self._errors = {}
 
-        for path in sorted(PLUGINS_DIR.glob("*.py")):
+        paths = sorted(PLUGINS_DIR.glob("*.py"))
+        # Forget plugins whose file has been removed since the last scan
+        for gone in self._modules.keys() - set(paths):
+            del self._modules[gone]
+
+        for path in paths:
             name = path.stem
             try:
-                spec = importlib.util.spec_from_file_location(
-                    f"_sv_plugin_{name}", path
-                )
-                if spec is None or spec.loader is None:
-                    raise ImportError("Could not create module spec")
-                mod = importlib.util.module_from_spec(spec)
-                sys.modules[spec.name] = mod
-                spec.loader.exec_module(mod)  # type: ignore[union-attr]
+                st = path.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._modules.get(path)
+                if cached is not None and cached[0] == stamp:
+                    mod = cached[1]
+                else:
+                    self._modules.pop(path, None)
+                    mod = self._import(name, path)
+                    self._modules[path] = (stamp, mod)
                 if hasattr(mod, "setup"):
                     mod.setup(self.api)
                 self._loaded.append(name)
@@ -113,6 +130,16 @@ class PluginLoader:
 
         return self._loaded
 
+    @staticmethod
+    def _import(name: str, path: Path) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(f"_sv_plugin_{name}", path)
+        if spec is None or spec.loader is None:
+            raise ImportError("Could not create module spec")
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = mod
+        spec.loader.exec_module(mod)  # type: ignore[union-attr]
+        return mod
+
     @property
     def loaded(self) -> list[str]:
         return list(self._loaded)
@@ -20,7 +20,8 @@ from __future__ import annotations
 import re
 from typing import Optional
 
-from app.constants import ANSI_COLORS_16, ANSI_256_CACHE
+import app.constants as _c
+from app.constants import ANSI_256_CACHE
 
 # ---------------------------------------------------------------------------
 # Type alias
@@ -44,7 +45,7 @@ def color_256(n: int) -> str:
     if n in ANSI_256_CACHE:
         return ANSI_256_CACHE[n]
     if n < 16:
-        color = ANSI_COLORS_16[n]
+        color = _c.ANSI_COLORS_16[n]
     elif n < 232:
         idx = n - 16
         b = idx % 6
@@ -130,6 +131,7 @@ class AnsiParser:
         except ValueError:
             return
 
+        ansi_16 = _c.ANSI_COLORS_16
         i = 0
         while i < len(params):
             p = params[i]
@@ -149,13 +151,13 @@ class AnsiParser:
             elif p == 49:
                 self._bg = None
             elif 30 <= p <= 37:
-                self._fg = ANSI_COLORS_16[p - 30]
+                self._fg = ansi_16[p - 30]
             elif 40 <= p <= 47:
-                self._bg = ANSI_COLORS_16[p - 40]
+                self._bg = ansi_16[p - 40]
             elif 90 <= p <= 97:
-                self._fg = ANSI_COLORS_16[p - 90 + 8]
+                self._fg = ansi_16[p - 90 + 8]
             elif 100 <= p <= 107:
-                self._bg = ANSI_COLORS_16[p - 100 + 8]
+                self._bg = ansi_16[p - 100 + 8]
             elif p in (38, 48):
                 if i + 2 < len(params) and params[i + 1] == 5:
                     color = color_256(params[i + 2])
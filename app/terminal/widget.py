@@ -385,6 +385,7 @@ class SSHTerminalWidget(QWidget):
         self._ansi = AnsiParser()
         self._recording = False
         self._recorded_cmds: list[str] = []
+        self._macro_dlg = None  # MacroManagerDialog, built on first open
         self._transport = None
 
         self._build_ui()
@@ -734,9 +735,10 @@ class SSHTerminalWidget(QWidget):
                 self._worker.send(cmd.encode("utf-8"))
 
     def _open_macro_manager(self) -> None:
-        from app.macros.dialog import MacroManagerDialog
-        dlg = MacroManagerDialog(self, on_play=self._play_commands)
-        dlg.exec()
+        if self._macro_dlg is None:
+            from app.macros.dialog import MacroManagerDialog
+            self._macro_dlg = MacroManagerDialog(self, on_play=self._play_commands)
+        self._macro_dlg.exec()
 
     # ------------------------------------------------------------------
     # KeePass Auto-fill
@@ -10,7 +10,7 @@ Written by Christopher Malo
 
 from __future__ import annotations
 
-from app.constants import C, THEMES, _ansi_16, ANSI_COLORS_16, ANSI_256_CACHE
+from app.constants import C, THEMES, _ansi_16
 
 
 def stylesheet() -> str:
@@ -408,6 +408,14 @@ QLabel#status-connecting {{
     background-color: {C["surface0"]};
 }}
 
+QLabel#server-running {{
+    color: {C["green"]};
+}}
+
+QLabel#server-stopped {{
+    color: {C["red"]};
+}}
+
 /* ==========================================================================
    Checkboxes
    ========================================================================== */
@@ -514,16 +522,16 @@ QTabWidget#settings-tabs::pane {{
 def apply_theme(name: str) -> None:
     """Switch the active theme and re-apply the QSS to the running application.
 
-    This mutates the module-level ``C`` and ``ANSI_COLORS_16`` so that any
-    code that reads from them will pick up the new colors on the next call.
+    This updates the module-level ``C`` in place and rebinds
+    ``app.constants.ANSI_COLORS_16``, so any code that reads them will pick
+    up the new colors on the next call.
     """
     import app.constants as _c
     from PySide6.QtWidgets import QApplication
 
     palette = THEMES.get(name, _c.MOCHA)
     _c.C.update(palette)
-    new_ansi = _ansi_16(palette)
-    _c.ANSI_COLORS_16[:] = new_ansi
+    _c.ANSI_COLORS_16 = _ansi_16(palette)
     _c.ANSI_256_CACHE.clear()
 
     app = QApplication.instance()
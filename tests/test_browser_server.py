@@ -0,0 +1,169 @@
+import http.client
+import json
+import logging
+import socket
+import time
+import unittest
+import uuid
+from types import SimpleNamespace
+from unittest import mock
+
+from app.browser import server as server_mod
+from app.browser.server import BrowserServer
+from app.managers.keepass import keepass_manager
+
+
+class BrowserServerTests(unittest.TestCase):
+    def setUp(self):
+        self.server = BrowserServer()
+        self.server.start(0)
+        self.addCleanup(self.server.stop)
+        self.port = self.server._httpd.server_address[1]
+
+    def _request(self, method, path, body=None):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.addCleanup(conn.close)
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload else {}
+        conn.request(method, path, body=payload, headers=headers)
+        resp = conn.getresponse()
+        return resp, resp.read()
+
+    def test_ping_reports_no_open_database(self):
+        resp, raw = self._request("GET", "/ping?x=1")
+
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(resp.getheader("Access-Control-Allow-Origin"), "*")
+        data = json.loads(raw)
+        self.assertFalse(data["dbOpen"])
+        self.assertEqual(data["dbCount"], 0)
+
+    def test_unknown_post_path_is_not_found(self):
+        resp, raw = self._request("POST", "/nope", {"url": "https://a.test"})
+
+        self.assertEqual(resp.status, 404)
+        self.assertEqual(json.loads(raw), {"error": "not_found"})
+
+    def test_get_logins_requires_url(self):
+        resp, raw = self._request("POST", "/get-logins", {})
+
+        self.assertEqual(resp.status, 400)
+        self.assertEqual(json.loads(raw), {"error": "url_required"})
+
+    def test_get_logins_returns_matching_entries(self):
+        entry = SimpleNamespace(
+            uuid=uuid.UUID(int=1), title="Example", username=None,
+            password="pw", url="https://example.com",
+        )
+        keepass_manager._dbs["/tmp/browser.kdbx"] = SimpleNamespace(entries=[entry])
+        keepass_manager._active_path = "/tmp/browser.kdbx"
+        self.addCleanup(keepass_manager.lock)
+
+        resp, raw = self._request(
+            "POST", "/get-logins", {"url": "https://login.example.com/a"}
+        )
+
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(json.loads(raw), {"entries": [{
+            "uuid": str(uuid.UUID(int=1)),
+            "title": "Example",
+            "username": "",
+            "password": "pw",
+            "url": "https://example.com",
+        }]})
+
+    def test_non_string_fields_are_ignored(self):
+        resp, raw = self._request("POST", "/get-logins", {"url": 42})
+
+        self.assertEqual(resp.status, 400)
+        self.assertEqual(json.loads(raw), {"error": "url_required"})
+
+    def test_bad_content_length_is_not_read_and_closes_connection(self):
+        for length in ("-1", "abc"):
+            conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+            self.addCleanup(conn.close)
+            conn.putrequest("POST", "/get-logins")
+            conn.putheader("Content-Length", length)
+            conn.endheaders()
+            resp = conn.getresponse()
+
+            self.assertEqual(resp.status, 400)
+            self.assertEqual(json.loads(resp.read()), {"error": "url_required"})
+            self.assertTrue(resp.will_close)
+
+    def test_body_on_bodyless_verb_is_not_parsed_as_next_request(self):
+        smuggled = b"GET /ping HTTP/1.1\r\nHost: x\r\n\r\n"
+        for method in ("OPTIONS", "GET"):
+            sock = socket.create_connection(("127.0.0.1", self.port), timeout=5)
+            self.addCleanup(sock.close)
+            sock.sendall(
+                f"{method} /get-logins HTTP/1.1\r\nHost: x\r\n"
+                f"Content-Length: {len(smuggled)}\r\n\r\n".encode()
+                + smuggled
+            )
+            received = b""
+            while chunk := sock.recv(4096):
+                received += chunk
+
+            self.assertEqual(received.count(b"HTTP/1.1 "), 1, method)
+            self.assertIn(b"Connection: close", received)
+
+    def test_preflight_returns_cors_headers(self):
+        resp, _ = self._request("OPTIONS", "/get-logins")
+
+        self.assertEqual(resp.status, 204)
+        self.assertEqual(
+            resp.getheader("Access-Control-Allow-Methods"), "GET, POST, OPTIONS"
+        )
+
+    def test_connection_is_reused_between_requests(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.addCleanup(conn.close)
+
+        for _ in range(2):
+            conn.request("GET", "/ping")
+            resp = conn.getresponse()
+            resp.read()
+            self.assertEqual(resp.status, 200)
+            self.assertEqual(resp.version, 11)
+            self.assertFalse(resp.will_close)
+
+    def test_idle_keep_alive_connections_do_not_starve_new_requests(self):
+        workers = len(self.server._httpd._workers)
+        for _ in range(workers + 2):
+            conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+            self.addCleanup(conn.close)
+            conn.request("GET", "/ping")
+            conn.getresponse().read()
+
+        start = time.monotonic()
+        resp, _ = self._request("GET", "/ping")
+
+        self.assertEqual(resp.status, 200)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_idle_timeout_is_not_logged_as_an_error(self):
+        conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        self.addCleanup(conn.close)
+
+        with mock.patch.object(server_mod._Handler, "timeout", 0.1), \
+                self.assertLogs(server_mod.log, "DEBUG") as logs:
+            conn.request("GET", "/ping")
+            conn.getresponse().read()
+            time.sleep(0.3)
+
+        timed_out = [r for r in logs.records if "timed out" in r.getMessage()]
+        self.assertTrue(timed_out)
+        self.assertTrue(all(r.levelno == logging.DEBUG for r in timed_out))
+
+    def test_stop_releases_the_port_for_restart(self):
+        port = self.port
+        self.server.stop()
+        self.server.start(port)
+
+        resp, _ = self._request("GET", "/ping")
+        self.assertEqual(resp.status, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
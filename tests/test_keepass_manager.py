@@ -1,8 +1,14 @@
 import unittest
+import uuid
+from types import SimpleNamespace
 
 from app.managers.keepass import KeePassManager
 
 
+def _entry(url, uid=0):
+    return SimpleNamespace(url=url, uuid=uuid.UUID(int=uid))
+
+
 class KeePassManagerTests(unittest.TestCase):
     def test_close_db_keeps_path_known_and_marks_it_locked(self):
         manager = KeePassManager()
@@ -32,6 +38,96 @@ class KeePassManagerTests(unittest.TestCase):
         self.assertTrue(manager.is_path_locked("/tmp/a.kdbx"))
         self.assertFalse(manager.is_path_locked("/tmp/b.kdbx"))
 
+    def test_find_entries_for_host_matches_parent_and_child_domains(self):
+        exact = _entry("https://example.com/login")
+        child = _entry("https://login.example.com")
+        other = _entry("https://example.org")
+        manager = KeePassManager()
+        manager._dbs["/tmp/a.kdbx"] = SimpleNamespace(entries=[exact, child, other])
+        manager._active_path = "/tmp/a.kdbx"
+
+        self.assertEqual(manager.find_entries_for_host("EXAMPLE.com"), [exact, child])
+        self.assertEqual(manager.find_entries_for_host("login.example.com"), [exact, child])
+        self.assertEqual(manager.find_entries_for_url("https://example.org/x"), [other])
+        self.assertEqual(manager.find_entries_for_host(""), [])
+
+    def test_host_lookup_sees_updated_entry_url(self):
+        entry = _entry("https://old.example", uid=7)
+        manager = KeePassManager()
+        manager._dbs["/tmp/a.kdbx"] = SimpleNamespace(entries=[entry], save=lambda: None)
+        manager._active_path = "/tmp/a.kdbx"
+        self.assertEqual(manager.find_entries_for_host("old.example"), [entry])
+
+        manager.update_entry(str(entry.uuid), url="https://new.example")
+
+        self.assertEqual(manager.find_entries_for_host("old.example"), [])
+        self.assertEqual(manager.find_entries_for_host("new.example"), [entry])
+
+    def test_get_all_entries_is_cached_until_the_database_changes(self):
+        class FakeDb:
+            walks = 0
+            save = staticmethod(lambda: None)
+
+            def __init__(self, entries):
+                self._entries = entries
+
+            @property
+            def entries(self):
+                FakeDb.walks += 1
+                return list(self._entries)
+
+            def delete_entry(self, entry):
+                self._entries.remove(entry)
+
+        first, second = _entry("", uid=1), _entry("", uid=2)
+        manager = KeePassManager()
+        manager._dbs["/tmp/a.kdbx"] = FakeDb([first, second])
+        manager._active_path = "/tmp/a.kdbx"
+
+        listed = manager.get_all_entries()
+        listed.clear()
+        self.assertEqual(manager.get_all_entries(), [first, second])
+        self.assertEqual(FakeDb.walks, 1)
+
+        manager.delete_entry(str(first.uuid))
+
+        self.assertEqual(manager.get_all_entries(), [second])
+
+    def test_get_entry_by_uuid_uses_index_and_follows_deletes(self):
+        first, second = _entry("", uid=1), _entry("", uid=2)
+        db = SimpleNamespace(entries=[first, second], save=lambda: None)
+        db.delete_entry = db.entries.remove
+        manager = KeePassManager()
+        manager._dbs["/tmp/a.kdbx"] = db
+        manager._active_path = "/tmp/a.kdbx"
+
+        self.assertIs(manager.get_entry_by_uuid(str(second.uuid)), second)
+        self.assertIsNone(manager.get_entry_by_uuid("not-a-uuid"))
+        self.assertIsNone(manager.get_entry_by_uuid(str(first.uuid), "/tmp/missing.kdbx"))
+
+        self.assertTrue(manager.delete_entry(str(first.uuid)))
+
+        self.assertIsNone(manager.get_entry_by_uuid(str(first.uuid)))
+        self.assertIs(manager.get_entry_by_uuid(str(second.uuid)), second)
+
+    def test_caches_follow_changes_even_when_save_fails(self):
+        def fail():
+            raise OSError("read-only")
+
+        entry = _entry("https://example.com", uid=1)
+        db = SimpleNamespace(entries=[entry], save=fail)
+        db.delete_entry = db.entries.remove
+        manager = KeePassManager()
+        manager._dbs["/tmp/a.kdbx"] = db
+        manager._active_path = "/tmp/a.kdbx"
+        self.assertEqual(manager.find_entries_for_host("example.com"), [entry])
+
+        self.assertFalse(manager.delete_entry(str(entry.uuid)))
+
+        self.assertEqual(manager.find_entries_for_host("example.com"), [])
+        self.assertEqual(manager.get_all_entries(), [])
+        self.assertIsNone(manager.get_entry_by_uuid(str(entry.uuid)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,89 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.macros import manager as manager_mod
+from app.macros.manager import MacroManager
+
+
+class MacroManagerTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.file = self.dir / "macros.json"
+        for name, value in (("DATA_DIR", self.dir), ("MACROS_FILE", self.file)):
+            patcher = mock.patch.object(manager_mod, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_all_is_a_live_read_only_view_of_loaded_macros(self):
+        self.file.write_text(json.dumps({"Deploy": ["git pull"]}))
+        manager = MacroManager()
+        view = manager.all()
+
+        manager.save_macro("Build", ["make"])
+
+        self.assertEqual(dict(view), {"Deploy": ["git pull"], "Build": ["make"]})
+        with self.assertRaises(TypeError):
+            view["Other"] = []
+        self.assertEqual(manager.get("missing"), ())
+
+    def test_singleton_is_created_on_first_access(self):
+        manager_mod.get_macro_manager.cache_clear()
+        self.addCleanup(manager_mod.get_macro_manager.cache_clear)
+        self.assertEqual(manager_mod.get_macro_manager.cache_info().currsize, 0)
+
+        from app.macros.manager import macro_manager
+
+        self.assertIs(macro_manager, manager_mod.get_macro_manager())
+        self.assertEqual(manager_mod.get_macro_manager.cache_info().currsize, 1)
+
+    def test_rename_moves_commands_and_refuses_taken_names(self):
+        manager = MacroManager()
+        manager.save_macro("Deploy", ["git pull"])
+        manager.save_macro("Build", ["make"])
+
+        self.assertFalse(manager.rename("Deploy", "Build"))
+        self.assertFalse(manager.rename("missing", "Other"))
+        self.assertTrue(manager.rename("Deploy", "Release"))
+
+        self.assertEqual(
+            json.loads(self.file.read_text()),
+            {"Build": ["make"], "Release": ["git pull"]},
+        )
+
+    def test_unchanged_contents_are_not_rewritten(self):
+        manager = MacroManager()
+        manager.save_macro("Deploy", ["git pull"])
+
+        with mock.patch.object(manager_mod, "atomic_write") as write:
+            manager.save_macro("Deploy", ["git pull"])
+            manager.delete_macro("missing")
+            write.assert_not_called()
+
+            manager.save_macro("Deploy", ["git pull", "make"])
+            write.assert_called_once()
+
+    def test_names_are_cached_until_a_mutation(self):
+        manager = MacroManager()
+        manager.save_macro("b", ["ls"])
+        manager.save_macro("a", ["ls"])
+
+        names = manager.names()
+        self.assertEqual(names, ["a", "b"])
+        self.assertIs(manager.names(), names)
+
+        self.assertTrue(manager.rename("b", "c"))
+        self.assertEqual(manager.names(), ["a", "c"])
+
+    def test_unchanged_contents_are_restored_if_the_file_went_missing(self):
+        manager = MacroManager()
+        manager.save_macro("Deploy", ["git pull"])
+        self.file.unlink()
+
+        manager.save_macro("Deploy", ["git pull"])
+
+        self.assertEqual(json.loads(self.file.read_text()), {"Deploy": ["git pull"]})
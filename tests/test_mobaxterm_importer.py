@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from app.importers.mobaxterm import MobaXtermImporter
+
+
+class MobaXtermImporterTests(unittest.TestCase):
+    def _parse(self, text):
+        fd, path = tempfile.mkstemp(suffix=".mxtsessions")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", encoding="utf-8-sig") as fh:
+            fh.write(text)
+        return MobaXtermImporter.parse_file(path)
+
+    def test_parses_old_and_new_formats_with_subrep_folders(self):
+        sessions = self._parse(
+            "; exported sessions\n"
+            "[Bookmarks]\n"
+            "SubRep=\n"
+            "ImgNum=42\n"
+            "Old=#0#10.0.0.1#2222#root#extra#fields\n"
+            "[Bookmarks_1]\n"
+            "SubRep=Production\\Web\n"
+            "ImgNum=41\n"
+            "New = #109#0%web.example%22%deploy%%-1%%%\n"
+            "Rdp=#91#4%rdp.example%3389%admin%\n"
+            "Bad=#109#0%db.example%notaport%\n"
+        )
+
+        self.assertEqual(
+            [(s.name, s.hostname, s.port, s.username, s.folder) for s in sessions],
+            [
+                ("Old", "10.0.0.1", 2222, "root", "Bookmarks"),
+                ("New", "web.example", 22, "deploy", "Production\\Web"),
+                ("Bad", "db.example", 22, "", "Production\\Web"),
+            ],
+        )
+
+    def test_duplicate_names_in_a_section_get_a_counter_suffix(self):
+        sessions = self._parse(
+            "[Bookmarks]\n"
+            "Box=#109#0%a.example%22%u%\n"
+            "box=#109#0%b.example%22%u%\n"
+            "Box=#109#0%c.example%22%u%\n"
+        )
+
+        self.assertEqual(
+            [(s.name, s.hostname) for s in sessions],
+            [("Box", "a.example"), ("box (2)", "b.example"), ("Box (3)", "c.example")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.plugins import loader as loader_mod
+from app.plugins.loader import PluginLoader
+
+
+class PluginLoaderTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        patcher = mock.patch.object(loader_mod, "PLUGINS_DIR", self.dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write(self, name, body):
+        path = self.dir / f"{name}.py"
+        path.write_text(body)
+        return path
+
+    def test_reload_reuses_unchanged_modules_without_duplicating_actions(self):
+        self._write(
+            "hello",
+            "IMPORTS = globals().get('IMPORTS', 0) + 1\n"
+            "def setup(api):\n"
+            "    api.add_menu_action('Hello', lambda: None)\n",
+        )
+        self._write("broken", "raise RuntimeError('boom')\n")
+        loader = PluginLoader()
+
+        self.assertEqual(loader.load_all(), ["hello"])
+        self.assertEqual(loader.load_all(), ["hello"])
+
+        self.assertEqual([label for label, _ in loader.api.menu_actions], ["Hello"])
+        self.assertEqual(loader._modules[self.dir / "hello.py"][1].IMPORTS, 1)
+        self.assertEqual(loader.errors, {"broken": "boom"})
+
+    def test_changed_plugin_is_imported_again(self):
+        path = self._write("greet", "LABEL = 'one'\n")
+        loader = PluginLoader()
+        loader.load_all()
+
+        path.write_text("LABEL = 'two, longer'\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        loader.load_all()
+
+        self.assertEqual(loader._modules[path][1].LABEL, "two, longer")
+
+    def test_deleted_plugin_is_dropped_from_the_cache(self):
+        keep = self._write("keep", "")
+        gone = self._write("gone", "")
+        loader = PluginLoader()
+        loader.load_all()
+
+        gone.unlink()
+
+        self.assertEqual(loader.load_all(), ["keep"])
+        self.assertEqual(list(loader._modules), [keep])
+
+
+if __name__ == "__main__":
+    unittest.main()
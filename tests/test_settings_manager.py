@@ -0,0 +1,37 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.managers import _jsonio
+from app.managers import settings as settings_mod
+from app.managers.settings import SettingsManager
+
+
+class SettingsManagerTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.file = self.dir / "settings.json"
+        for name, value in (("DATA_DIR", self.dir), ("SETTINGS_FILE", self.file)):
+            patcher = mock.patch.object(settings_mod, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_update_replaces_the_file_in_one_write(self):
+        self.file.write_text(json.dumps({"theme": "Dracula"}))
+        manager = SettingsManager()
+
+        with mock.patch.object(
+            _jsonio.os, "replace", wraps=_jsonio.os.replace
+        ) as replace:
+            manager.update({"browser_port": 19457, "font_size_terminal": 12})
+            replace.assert_called_once_with(self.file.with_suffix(".tmp"), self.file)
+
+        data = json.loads(self.file.read_text())
+        self.assertEqual(data["theme"], "Dracula")
+        self.assertEqual(data["browser_port"], 19457)
+        self.assertEqual(data["font_size_terminal"], 12)
+        self.assertEqual(list(self.dir.iterdir()), [self.file])